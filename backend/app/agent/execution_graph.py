@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field, SecretStr
 from app.agent.state import ExecutionState
 from app.agent.tools import get_available_tools
 from app.core.config import get_settings
+from app.core.http import get_http_client
 from app.models.artifact import ArtifactCreate
 from app.models.base import ArtifactType
 from app.services.artifact_service import artifact_service
@@ -240,6 +241,7 @@ def create_execution_graph() -> StateGraph[ExecutionState]:
         model="gpt-4o",
         api_key=SecretStr(settings.openai_api_key),
         streaming=True,
+        http_async_client=get_http_client(),
     )
 
     # Bind tools to the LLM
@@ -250,6 +252,7 @@ def create_execution_graph() -> StateGraph[ExecutionState]:
         model="gpt-4o",
         api_key=SecretStr(settings.openai_api_key),
         streaming=False,
+        http_async_client=get_http_client(),
     ).with_structured_output(TaskResult)
 
     # Create LLM for artifact creation decision
@@ -257,9 +260,13 @@ def create_execution_graph() -> StateGraph[ExecutionState]:
         model="gpt-4o",
         api_key=SecretStr(settings.openai_api_key),
         streaming=False,
+        http_async_client=get_http_client(),
     ).with_structured_output(ArtifactDecision)
 
     # Create tool node
+    # ToolNode dispatches all tool calls from one AIMessage concurrently
+    # (asyncio.gather), so independent web/artifact calls overlap and results
+    # are emitted as ToolMessages in the original call order.
     tool_node = ToolNode(tools)
 
     async def agent_node(state: ExecutionState) -> dict[str, Any]:
@@ -737,12 +744,13 @@ async def create_execution_summary(
             model="gpt-4o",
             api_key=SecretStr(settings.openai_api_key),
             streaming=False,
+            http_async_client=get_http_client(),
         ).with_structured_output(ExecutionSummary)
 
         # Generate summary
         result = cast(
             ExecutionSummary,
-            summary_llm.invoke(
+            await summary_llm.ainvoke(
                 [
                     SystemMessage(content=prompt),
                     HumanMessage(content="Generate the execution summary."),
@@ -1,20 +1,23 @@
 """LangGraph planning agent definition."""
 
 from datetime import datetime
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from langchain_core.messages import SystemMessage
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
 
 from app.agent.state import PlanningState
 from app.core.config import get_settings
+from app.core.http import get_http_client
 
 
 class TaskItem(BaseModel):
     """A single task item."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str = Field(description="Short, action-oriented task title")
     description: str | None = Field(
         default=None, description="Optional detailed description"
@@ -24,6 +27,8 @@ class TaskItem(BaseModel):
 class TaskList(BaseModel):
     """Structured output for task extraction."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     tasks: list[TaskItem] = Field(default_factory=list)
     ready_to_create_tasks: bool = Field(
         default=False,
@@ -144,6 +149,27 @@ Now respond to the user in a friendly, conversational way that:
 Remember: The tasks are visible in the sidebar. First ask questions to refine the plan, then once they've answered, let them know they can execute."""
 
 
+EXECUTION_COMPLETE_MARKER = "[EXECUTION COMPLETE]"
+
+
+def _is_exec_summary(message: Any) -> bool:
+    """Check whether a message is an execution summary request.
+
+    String content is searched directly. For list content only the first
+    text part is inspected, avoiding a str() of the whole content list.
+    """
+    content = getattr(message, "content", None)
+    if isinstance(content, str):
+        return EXECUTION_COMPLETE_MARKER in content
+    if isinstance(content, list):
+        for part in content:
+            if isinstance(part, str):
+                return EXECUTION_COMPLETE_MARKER in part
+            if isinstance(part, dict) and part.get("type") == "text":
+                return EXECUTION_COMPLETE_MARKER in str(part.get("text", ""))
+    return False
+
+
 def create_planning_graph() -> StateGraph[PlanningState]:
     """Create the planning agent graph.
 
@@ -159,13 +185,16 @@ def create_planning_graph() -> StateGraph[PlanningState]:
         model="gpt-4o",
         api_key=SecretStr(settings.openai_api_key),
         streaming=True,
+        http_async_client=get_http_client(),
     )
 
-    # Task extraction LLM (structured output, no streaming)
+    # Task extraction LLM (structured output, streamed so task titles can be
+    # surfaced to the UI before the full JSON arrives)
     task_llm = ChatOpenAI(
         model="gpt-4o",
         api_key=SecretStr(settings.openai_api_key),
-        streaming=False,
+        streaming=True,
+        http_async_client=get_http_client(),
     ).with_structured_output(TaskList)
 
     async def should_extract_node(state: PlanningState) -> dict[str, object]:
@@ -177,13 +206,7 @@ def create_planning_graph() -> StateGraph[PlanningState]:
 
         # Check if this is an execution summary request - skip extraction
         last_message = messages[-1] if messages else None
-        is_execution_summary = (
-            last_message
-            and hasattr(last_message, "content")
-            and "[EXECUTION COMPLETE]" in str(last_message.content)
-        )
-
-        if is_execution_summary:
+        if _is_exec_summary(last_message):
             return {
                 "tasks": [],
                 "ready_to_create_tasks": False,
@@ -196,11 +219,7 @@ def create_planning_graph() -> StateGraph[PlanningState]:
         messages_with_system = [system_msg, *messages]
         result = cast(TaskList, await task_llm.ainvoke(messages_with_system))
 
-        tasks = []
-        if result.ready_to_create_tasks and result.tasks:
-            tasks = [
-                {"title": t.title, "description": t.description} for t in result.tasks
-            ]
+        tasks = result.model_dump()["tasks"] if result.ready_to_create_tasks else []
 
         return {
             "tasks": tasks,
@@ -237,13 +256,9 @@ def create_planning_graph() -> StateGraph[PlanningState]:
 
         # Check for execution summary
         last_message = messages[-1] if messages else None
-        is_execution_summary = (
-            last_message
-            and hasattr(last_message, "content")
-            and "[EXECUTION COMPLETE]" in str(last_message.content)
+        prompt = (
+            EXECUTION_SUMMARY_PROMPT if _is_exec_summary(last_message) else CHAT_PROMPT
         )
-
-        prompt = EXECUTION_SUMMARY_PROMPT if is_execution_summary else CHAT_PROMPT
         system_msg = SystemMessage(content=prompt)
         messages_with_system = [system_msg, *messages]
 
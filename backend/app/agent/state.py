@@ -6,6 +6,13 @@ from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
 
+class TaskDict(TypedDict):
+    """Plain task payload produced by task extraction."""
+
+    title: str
+    description: str | None
+
+
 class PlanningState(TypedDict):
     """State for the planning agent.
 
@@ -24,7 +31,7 @@ class PlanningState(TypedDict):
     session_id: str
 
     # Generated tasks (list of dicts with title, description)
-    tasks: list[dict[str, str | None]]
+    tasks: list[TaskDict]
 
     # Whether planning is complete
     is_complete: bool
@@ -1,5 +1,6 @@
 """Agent tools - Web search, calculator, datetime, artifacts, and other execution tools."""
 
+from functools import lru_cache
 from typing import Any
 
 from app.agent.tools.calculator import calculator
@@ -12,8 +13,31 @@ from app.agent.tools.datetime_tool import (
     get_day_of_week,
 )
 from app.agent.tools.read_artifact import list_artifacts, read_artifact
-from app.agent.tools.web_fetch import web_fetch
-from app.agent.tools.web_search import web_search
+
+# Tavily-based tools are imported on first use, since the Tavily client is a
+# heavy import that is not needed when TAVILY_API_KEY is unset
+_LAZY_TOOLS: dict[str, str] = {
+    "web_search": "app.agent.tools.web_search",
+    "web_fetch": "app.agent.tools.web_fetch",
+}
+
+
+def _load_lazy_tool(name: str) -> Any:
+    """Import a Tavily-based tool and bind it on this package."""
+    from importlib import import_module
+
+    tool = getattr(import_module(_LAZY_TOOLS[name]), name)
+    # Importing the submodule binds it on the package under the same name,
+    # so rebind the tool itself, as an eager import would
+    globals()[name] = tool
+    return tool
+
+
+def __getattr__(name: str) -> Any:
+    """Import Tavily-based tools on first attribute access."""
+    if name not in _LAZY_TOOLS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load_lazy_tool(name)
 
 
 def get_available_tools() -> list[Any]:
@@ -23,6 +47,12 @@ def get_available_tools() -> list[Any]:
     Tavily-based tools (web_search, web_fetch) are only included
     if TAVILY_API_KEY is configured.
     """
+    return list(_resolve_tools())
+
+
+@lru_cache(maxsize=1)
+def _resolve_tools() -> tuple[Any, ...]:
+    """Build the tool list once per process."""
     from app.core.config import get_settings
 
     settings = get_settings()
@@ -42,10 +72,10 @@ def get_available_tools() -> list[Any]:
 
     # Add Tavily tools only if API key is configured
     if settings.tavily_api_key:
-        tools.insert(0, web_search)
-        tools.insert(1, web_fetch)
+        tools.insert(0, _load_lazy_tool("web_search"))
+        tools.insert(1, _load_lazy_tool("web_fetch"))
 
-    return tools
+    return tuple(tools)
 
 
 __all__ = [
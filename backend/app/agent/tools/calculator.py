@@ -3,6 +3,8 @@
 import ast
 import math
 import operator
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.tools import tool
@@ -46,63 +48,102 @@ SAFE_CONSTANTS: dict[str, float] = {
 }
 
 
-class SafeEvaluator(ast.NodeVisitor):
-    """Safe expression evaluator that only allows basic math operations."""
+def _checked_division(op: Any) -> Any:
+    """Wrap a division-like operator so a zero divisor is rejected."""
 
-    def visit(self, node: ast.AST) -> Any:
-        """Visit a node and evaluate it safely."""
-        return super().visit(node)
+    def checked(left: Any, right: Any) -> Any:
+        if right == 0:
+            raise ValueError("Division by zero is not allowed")
+        return op(left, right)
+
+    return checked
+
+
+def _checked_pow(left: Any, right: Any) -> Any:
+    """Exponentiation that limits the exponent to prevent huge numbers."""
+    if isinstance(right, (int, float)) and abs(right) > 1000:
+        raise ValueError("Exponent too large (max 1000)")
+    return operator.pow(left, right)
+
+
+# Operators whose operands must be checked at evaluation time, mapped to the
+# name of the guard function they are lowered to
+GUARDED_OPERATORS: dict[type, str] = {
+    ast.Div: "_div",
+    ast.FloorDiv: "_floordiv",
+    ast.Mod: "_mod",
+    ast.Pow: "_pow",
+}
+
+# Globals for evaluating compiled expressions (no builtins available)
+_EVAL_GLOBALS: dict[str, Any] = {
+    "__builtins__": {},
+    **SAFE_FUNCTIONS,
+    **SAFE_CONSTANTS,
+    "_div": _checked_division(operator.truediv),
+    "_floordiv": _checked_division(operator.floordiv),
+    "_mod": _checked_division(operator.mod),
+    "_pow": _checked_pow,
+}
 
-    def visit_Expression(self, node: ast.Expression) -> Any:
-        """Evaluate an expression node."""
-        return self.visit(node.body)
 
-    def visit_Constant(self, node: ast.Constant) -> Any:
-        """Evaluate a constant (number)."""
+class SafeCompiler(ast.NodeTransformer):
+    """Validate an expression AST and lower it for safe compilation.
+
+    Only numbers, the safe constants, safe operators and calls to safe
+    functions are accepted. Division and exponentiation are rewritten into
+    calls to guard functions that keep the zero-divisor and exponent checks.
+    """
+
+    def visit_Expression(self, node: ast.Expression) -> ast.Expression:
+        """Validate an expression node."""
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:
+        """Validate a constant (number)."""
         if isinstance(node.value, (int, float)):
-            return node.value
+            return node
         raise ValueError(f"Unsupported constant type: {type(node.value)}")
 
-    def visit_Num(self, node: ast.Num) -> Any:
-        """Evaluate a number (legacy AST node for older Python)."""
-        return node.n
-
-    def visit_Name(self, node: ast.Name) -> Any:
-        """Evaluate a named constant (pi, e)."""
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        """Validate a named constant (pi, e)."""
         if node.id in SAFE_CONSTANTS:
-            return SAFE_CONSTANTS[node.id]
+            return node
         raise ValueError(f"Unknown variable: {node.id}")
 
-    def visit_BinOp(self, node: ast.BinOp) -> Any:
-        """Evaluate a binary operation."""
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:
+        """Validate a binary operation."""
         op_type = type(node.op)
         if op_type not in SAFE_OPERATORS:
             raise ValueError(f"Unsupported operator: {op_type.__name__}")
 
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-
-        # Prevent division by zero
-        if op_type in (ast.Div, ast.FloorDiv, ast.Mod) and right == 0:
-            raise ValueError("Division by zero is not allowed")
-
-        # Limit exponentiation to prevent huge numbers
-        if op_type == ast.Pow and isinstance(right, (int, float)) and abs(right) > 1000:
-            raise ValueError("Exponent too large (max 1000)")
-
-        return SAFE_OPERATORS[op_type](left, right)
-
-    def visit_UnaryOp(self, node: ast.UnaryOp) -> Any:
-        """Evaluate a unary operation."""
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+
+        guard = GUARDED_OPERATORS.get(op_type)
+        if guard is None:
+            return node
+        return ast.copy_location(
+            ast.Call(
+                func=ast.Name(id=guard, ctx=ast.Load()),
+                args=[node.left, node.right],
+                keywords=[],
+            ),
+            node,
+        )
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.UnaryOp:
+        """Validate a unary operation."""
         op_type = type(node.op)
         if op_type not in SAFE_OPERATORS:
             raise ValueError(f"Unsupported unary operator: {op_type.__name__}")
 
-        operand = self.visit(node.operand)
-        return SAFE_OPERATORS[op_type](operand)
+        node.operand = self.visit(node.operand)
+        return node
 
-    def visit_Call(self, node: ast.Call) -> Any:
-        """Evaluate a function call."""
+    def visit_Call(self, node: ast.Call) -> ast.Call:
+        """Validate a function call."""
         if not isinstance(node.func, ast.Name):
             raise ValueError("Only simple function calls are allowed")
 
@@ -110,14 +151,86 @@ class SafeEvaluator(ast.NodeVisitor):
         if func_name not in SAFE_FUNCTIONS:
             raise ValueError(f"Unknown function: {func_name}")
 
-        args = [self.visit(arg) for arg in node.args]
-        return SAFE_FUNCTIONS[func_name](*args)
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported")
 
-    def generic_visit(self, node: ast.AST) -> Any:
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
         """Reject any other AST node types."""
         raise ValueError(f"Unsupported expression: {type(node).__name__}")
 
 
+class ConstantFolder(ast.NodeTransformer):
+    """Fold sub-expressions whose operands are all constants.
+
+    Runs on a tree already validated and lowered by SafeCompiler, so only
+    whitelisted operators and functions are ever evaluated. Sub-expressions
+    that raise are left in place so the error surfaces at evaluation time.
+    """
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        """Replace named constants with their values."""
+        if node.id in SAFE_CONSTANTS:
+            return ast.copy_location(ast.Constant(SAFE_CONSTANTS[node.id]), node)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:
+        """Fold a binary operation on two constants."""
+        self.generic_visit(node)
+        if isinstance(node.left, ast.Constant) and isinstance(node.right, ast.Constant):
+            op = SAFE_OPERATORS[type(node.op)]
+            return self._fold(node, op, node.left.value, node.right.value)
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.expr:
+        """Fold a unary operation on a constant."""
+        self.generic_visit(node)
+        if isinstance(node.operand, ast.Constant):
+            op = SAFE_OPERATORS[type(node.op)]
+            return self._fold(node, op, node.operand.value)
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.expr:
+        """Fold a safe function or guard call with constant arguments."""
+        node.args = [self.visit(arg) for arg in node.args]
+        constants = [arg for arg in node.args if isinstance(arg, ast.Constant)]
+        if isinstance(node.func, ast.Name) and len(constants) == len(node.args):
+            func = _EVAL_GLOBALS[node.func.id]
+            return self._fold(node, func, *(arg.value for arg in constants))
+        return node
+
+    @staticmethod
+    def _fold(node: ast.expr, func: Any, *args: Any) -> ast.expr:
+        """Evaluate func(*args) into a constant, or keep the node on error."""
+        try:
+            value = func(*args)
+        except Exception:
+            return node
+        if not isinstance(value, (int, float)):
+            return node
+        return ast.copy_location(ast.Constant(value), node)
+
+
+@lru_cache(maxsize=512)
+def _compile(expression: str) -> Callable[[], Any]:
+    """Parse, validate and compile an expression into a zero-arg callable.
+
+    Constant sub-expressions are folded at compile time, and results are
+    cached per expression string, so repeated evaluations skip parsing,
+    validation and constant arithmetic entirely.
+
+    Raises:
+        ValueError: If the expression contains unsafe operations
+        SyntaxError: If the expression is malformed
+    """
+    tree = SafeCompiler().visit(ast.parse(expression, mode="eval"))
+    tree = ConstantFolder().visit(tree)
+    code = compile(ast.fix_missing_locations(tree), "<calculator>", "eval")
+    return lambda: eval(code, _EVAL_GLOBALS)
+
+
 def safe_eval(expression: str) -> float:
     """Safely evaluate a mathematical expression.
 
@@ -131,14 +244,7 @@ def safe_eval(expression: str) -> float:
         ValueError: If the expression contains unsafe operations
         SyntaxError: If the expression is malformed
     """
-    # Parse the expression
-    tree = ast.parse(expression, mode="eval")
-
-    # Evaluate safely
-    evaluator = SafeEvaluator()
-    result = evaluator.visit(tree)
-
-    return float(result)
+    return float(_compile(expression)())
 
 
 @tool
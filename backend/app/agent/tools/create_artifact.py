@@ -1,14 +1,17 @@
 """Create artifact tool for the execution agent."""
 
 from typing import Literal
-from uuid import UUID
 
 from langchain_core.tools import tool
 
-from app.models.artifact import ArtifactCreate
+from app.core.validation import parse_uuid
+from app.models.artifact import ArtifactCreate, content_exceeds_limit
 from app.models.base import ArtifactType
 from app.services.artifact_service import artifact_service
 
+# Artifact types keyed by value, for validating tool input without exceptions
+_VALID_ARTIFACT_TYPES: dict[str, ArtifactType] = {t.value: t for t in ArtifactType}
+
 
 @tool
 async def create_artifact(
@@ -44,23 +47,30 @@ async def create_artifact(
     """
     try:
         # Validate artifact type
-        try:
-            art_type = ArtifactType(artifact_type)
-        except ValueError:
+        art_type = _VALID_ARTIFACT_TYPES.get(artifact_type)
+        if art_type is None:
             return f"Error: Invalid artifact type '{artifact_type}'. Must be one of: document, note, summary, plan, other"
 
         # Validate content size (100KB limit)
-        if len(content.encode("utf-8")) > 102400:
+        if content_exceeds_limit(content):
             return "Error: Artifact content exceeds 100KB limit. Please reduce the content size."
 
+        # Validate IDs
+        session_uuid = parse_uuid(session_id)
+        if session_uuid is None:
+            return f"Error creating artifact: Invalid UUID format - session_id '{session_id}'"
+        task_uuid = parse_uuid(task_id) if task_id else None
+        if task_id and task_uuid is None:
+            return f"Error creating artifact: Invalid UUID format - task_id '{task_id}'"
+
         # Validate name length
         if len(name) > 200:
             name = name[:200]
 
         # Create the artifact
         artifact_data = ArtifactCreate(
-            session_id=UUID(session_id),
-            task_id=UUID(task_id) if task_id else None,
+            session_id=session_uuid,
+            task_id=task_uuid,
             name=name,
             type=art_type,
             content=content,
@@ -71,6 +81,6 @@ async def create_artifact(
         return f"Successfully created {artifact_type} artifact '{name}' (ID: {artifact.id})"
 
     except ValueError as e:
-        return f"Error creating artifact: Invalid UUID format - {e}"
+        return f"Error creating artifact: {e}"
     except Exception as e:
         return f"Error creating artifact: {e}"
@@ -1,6 +1,8 @@
 """Datetime tool for date and time operations."""
 
+import calendar
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Literal
 from zoneinfo import ZoneInfo
 
@@ -29,6 +31,46 @@ DATETIME_FORMATS: dict[str, str] = {
     "compact": "%Y-%m-%d %H:%M:%S",
 }
 
+# Output formats accepted by get_current_datetime
+CURRENT_DATETIME_FORMATS: dict[str, str] = {
+    "iso": DATETIME_FORMATS["iso"],
+    "full": DATETIME_FORMATS["full"],
+    "compact": DATETIME_FORMATS["compact"],
+    "date_only": DATE_FORMATS["iso"],
+    "time_only": TIME_FORMATS["24h"],
+}
+
+
+@lru_cache(maxsize=64)
+def _tz(name: str) -> ZoneInfo:
+    """Return a cached ZoneInfo for the given timezone name."""
+    return ZoneInfo(name)
+
+
+def _parse_date(date_string: str, date_format: str) -> datetime:
+    """Parse a date string, using fromisoformat for plain ISO dates.
+
+    Only strings shaped exactly like YYYY-MM-DD take the fast path, so the
+    accepted inputs match strptime with the "%Y-%m-%d" format.
+    """
+    if (
+        date_format == DATE_FORMATS["iso"]
+        and len(date_string) == 10
+        and date_string[4] == "-"
+        and date_string[7] == "-"
+    ):
+        try:
+            return datetime.fromisoformat(date_string)
+        except ValueError:
+            pass
+    return datetime.strptime(date_string, date_format)
+
+
+def _replace_year_month(date: datetime, year: int, month: int) -> datetime:
+    """Move a date to another year and month, clamping the day to fit."""
+    day = min(date.day, calendar.monthrange(year, month)[1])
+    return date.replace(year=year, month=month, day=day)
+
 
 @tool
 def get_current_datetime(
@@ -53,21 +95,12 @@ def get_current_datetime(
         The current date/time as a formatted string
     """
     try:
-        tz = ZoneInfo(timezone)
-        now = datetime.now(tz)
-
-        if format == "iso":
-            return now.strftime(DATETIME_FORMATS["iso"])
-        elif format == "full":
-            return now.strftime(DATETIME_FORMATS["full"])
-        elif format == "compact":
-            return now.strftime(DATETIME_FORMATS["compact"])
-        elif format == "date_only":
-            return now.strftime(DATE_FORMATS["iso"])
-        elif format == "time_only":
-            return now.strftime(TIME_FORMATS["24h"])
-        else:
+        now = datetime.now(_tz(timezone))
+
+        format_str = CURRENT_DATETIME_FORMATS.get(format)
+        if format_str is None:
             return now.isoformat()
+        return now.strftime(format_str)
 
     except Exception as e:
         return f"Error getting current datetime: {e}"
@@ -99,7 +132,7 @@ def format_date(
         The formatted date string
     """
     try:
-        date = datetime.strptime(date_string, input_format)
+        date = _parse_date(date_string, input_format)
         format_str = DATE_FORMATS.get(output_format, DATE_FORMATS["iso"])
         return date.strftime(format_str)
 
@@ -132,8 +165,8 @@ def calculate_date_difference(
         The difference between the dates in the specified unit
     """
     try:
-        d1 = datetime.strptime(date1, date_format)
-        d2 = datetime.strptime(date2, date_format)
+        d1 = _parse_date(date1, date_format)
+        d2 = _parse_date(date2, date_format)
 
         delta = d2 - d1
         days = delta.days
@@ -187,51 +220,19 @@ def add_time_to_date(
         The resulting date in ISO format
     """
     try:
-        date = datetime.strptime(date_string, date_format)
+        date = _parse_date(date_string, date_format)
 
         # Add days and weeks directly
         date = date + timedelta(days=days, weeks=weeks)
 
-        # Handle months by adjusting month and year
+        # Handle months by shifting the month index, carrying into the year
         if months != 0:
-            new_month = date.month + months
-            new_year = date.year
-
-            # Handle month overflow/underflow
-            while new_month > 12:
-                new_month -= 12
-                new_year += 1
-            while new_month < 1:
-                new_month += 12
-                new_year -= 1
-
-            # Handle day overflow for shorter months
-            max_day = 31
-            if new_month in (4, 6, 9, 11):
-                max_day = 30
-            elif new_month == 2:
-                # Check leap year
-                if (new_year % 4 == 0 and new_year % 100 != 0) or (new_year % 400 == 0):
-                    max_day = 29
-                else:
-                    max_day = 28
-
-            new_day = min(date.day, max_day)
-            date = date.replace(year=new_year, month=new_month, day=new_day)
-
-        # Handle years
+            year_offset, month_index = divmod(date.month - 1 + months, 12)
+            date = _replace_year_month(date, date.year + year_offset, month_index + 1)
+
+        # Handle years (Feb 29 clamps to Feb 28 in non-leap years)
         if years != 0:
-            new_year = date.year + years
-            # Handle Feb 29 in non-leap years
-            if date.month == 2 and date.day == 29:
-                if not (
-                    (new_year % 4 == 0 and new_year % 100 != 0) or (new_year % 400 == 0)
-                ):
-                    date = date.replace(year=new_year, day=28)
-                else:
-                    date = date.replace(year=new_year)
-            else:
-                date = date.replace(year=new_year)
+            date = _replace_year_month(date, date.year + years, date.month)
 
         return date.strftime(DATE_FORMATS["iso"])
 
@@ -260,7 +261,7 @@ def get_day_of_week(
         The day of the week (e.g., "Monday", "Tuesday")
     """
     try:
-        date = datetime.strptime(date_string, date_format)
+        date = _parse_date(date_string, date_format)
         return date.strftime("%A")
 
     except ValueError as e:
@@ -1,12 +1,21 @@
 """Read artifact tool for the execution agent."""
 
-from uuid import UUID
-
 from langchain_core.tools import tool
 
+from app.core.validation import parse_uuid
+from app.models.artifact import ArtifactSummary
+from app.services.artifact_loader import current_loader
 from app.services.artifact_service import artifact_service
 
 
+def _format_artifact_entry(artifact: ArtifactSummary) -> str:
+    """Format one artifact for the list_artifacts output."""
+    task_info = f" (Task: {artifact.task_id})" if artifact.task_id else ""
+    return (
+        f"- [{artifact.type.value}] {artifact.name}{task_info}\n  ID: {artifact.id}\n"
+    )
+
+
 @tool
 async def read_artifact(artifact_id: str) -> str:
     """Read the content of an existing artifact.
@@ -23,8 +32,12 @@ async def read_artifact(artifact_id: str) -> str:
     Returns:
         The artifact's content, or an error message if not found
     """
+    artifact_uuid = parse_uuid(artifact_id)
+    if artifact_uuid is None:
+        return f"Error reading artifact: Invalid UUID format - '{artifact_id}'"
+
     try:
-        artifact = await artifact_service.get(UUID(artifact_id))
+        artifact = await current_loader().load(artifact_uuid)
 
         if not artifact:
             return f"Error: Artifact with ID '{artifact_id}' not found."
@@ -37,8 +50,6 @@ Created: {artifact.created_at.isoformat()}
 {artifact.content}
 """
 
-    except ValueError as e:
-        return f"Error reading artifact: Invalid UUID format - {e}"
     except Exception as e:
         return f"Error reading artifact: {e}"
 
@@ -56,22 +67,19 @@ async def list_artifacts(session_id: str) -> str:
     Returns:
         A formatted list of artifacts with their IDs, names, and types
     """
+    session_uuid = parse_uuid(session_id)
+    if session_uuid is None:
+        return f"Error listing artifacts: Invalid UUID format - '{session_id}'"
+
     try:
-        artifacts = await artifact_service.list_by_session(UUID(session_id))
+        artifacts = await artifact_service.list_by_session(session_uuid)
 
         if not artifacts:
             return "No artifacts found in this session."
 
-        lines = ["Artifacts in this session:", ""]
-        for artifact in artifacts:
-            task_info = f" (Task: {artifact.task_id})" if artifact.task_id else ""
-            lines.append(f"- [{artifact.type.value}] {artifact.name}{task_info}")
-            lines.append(f"  ID: {artifact.id}")
-            lines.append("")
-
-        return "\n".join(lines)
+        return "Artifacts in this session:\n\n" + "\n".join(
+            _format_artifact_entry(artifact) for artifact in artifacts
+        )
 
-    except ValueError as e:
-        return f"Error listing artifacts: Invalid UUID format - {e}"
     except Exception as e:
         return f"Error listing artifacts: {e}"
@@ -0,0 +1,14 @@
+"""Shared Tavily client for the web tools."""
+
+from functools import lru_cache
+
+from tavily import AsyncTavilyClient  # type: ignore[import-untyped]
+
+from app.core.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_tavily_client() -> AsyncTavilyClient:
+    """Get the process-wide async Tavily client."""
+    settings = get_settings()
+    return AsyncTavilyClient(api_key=settings.tavily_api_key)
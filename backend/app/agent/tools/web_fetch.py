@@ -1,19 +1,46 @@
 """Web fetch tool using Tavily Extract API."""
 
+import asyncio
+from typing import Any
+
 from langchain_core.tools import tool
-from tavily import TavilyClient  # type: ignore[import-untyped]
 
-from app.core.config import get_settings
+from app.agent.tools.tavily_client import get_tavily_client
+from app.core.cache import TTLCache
+
+# Extracted content by URL. Pages that yield no content are cached briefly so
+# repeated fetches of a dead URL don't each hit the API.
+_fetch_cache = TTLCache(maxsize=256, ttl=900)
+_EMPTY_RESULT_TTL = 60
+
+# Upper bound on a single extract round-trip
+_FETCH_TIMEOUT_SECONDS = 20.0
 
 
-def _get_tavily_client() -> TavilyClient:
-    """Get Tavily client with API key from settings."""
-    settings = get_settings()
-    return TavilyClient(api_key=settings.tavily_api_key)
+def _format_extract_response(response: dict[str, Any]) -> tuple[str, bool]:
+    """Format a Tavily extract response.
+
+    Returns:
+        The tool output and whether any content was extracted
+    """
+    results = response.get("results", [])
+    if not results:
+        failed = response.get("failed_results", [])
+        if failed:
+            return f"Failed to extract content from URL: {failed[0]}", False
+        return "No content could be extracted from the URL.", False
+
+    # Return the raw content from the first result
+    result = results[0]
+    raw_content = result.get("raw_content", "")
+    if not raw_content:
+        return "The page was fetched but contained no extractable content.", False
+
+    return str(raw_content), True
 
 
 @tool
-def web_fetch(url: str) -> str:
+async def web_fetch(url: str) -> str:
     """Fetch and extract content from a web page URL.
 
     Use this tool when you have a specific URL and need to read its full content.
@@ -27,25 +54,21 @@ def web_fetch(url: str) -> str:
         The extracted page content in markdown format
     """
     try:
-        client = _get_tavily_client()
-        response = client.extract(urls=url)
-
-        # Extract results from response
-        results = response.get("results", [])
-        if not results:
-            failed = response.get("failed_results", [])
-            if failed:
-                return f"Failed to extract content from URL: {failed[0]}"
-            return "No content could be extracted from the URL."
+        cached: str | None = _fetch_cache.get(url)
+        if cached is not None:
+            return cached
 
-        # Return the raw content from the first result
-        result = results[0]
-        raw_content = result.get("raw_content", "")
-        if not raw_content:
-            return "The page was fetched but contained no extractable content."
+        client = get_tavily_client()
+        response = await asyncio.wait_for(
+            client.extract(urls=url), timeout=_FETCH_TIMEOUT_SECONDS
+        )
 
-        return str(raw_content)
+        output, found = _format_extract_response(response)
+        _fetch_cache.set(url, output, ttl=None if found else _EMPTY_RESULT_TTL)
+        return output
 
+    except TimeoutError:
+        return "Error: Fetching the URL timed out. Please try again."
     except Exception as e:
         error_msg = str(e).lower()
         if "api key" in error_msg or "authentication" in error_msg:
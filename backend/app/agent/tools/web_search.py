@@ -1,19 +1,22 @@
 """Web search tool using Tavily API."""
 
+import asyncio
+
 from langchain_core.tools import tool
-from tavily import TavilyClient  # type: ignore[import-untyped]
 
-from app.core.config import get_settings
+from app.agent.tools.tavily_client import get_tavily_client
+from app.core.cache import TTLCache
 
+# Formatted results by query. Queries with no results are cached briefly.
+_search_cache = TTLCache(maxsize=256, ttl=900)
+_EMPTY_RESULT_TTL = 60
 
-def _get_tavily_client() -> TavilyClient:
-    """Get Tavily client with API key from settings."""
-    settings = get_settings()
-    return TavilyClient(api_key=settings.tavily_api_key)
+# Upper bound on a single search round-trip
+_SEARCH_TIMEOUT_SECONDS = 8.0
 
 
 @tool
-def web_search(query: str) -> str:
+async def web_search(query: str) -> str:
     """Search the web for current information.
 
     Use this tool when you need to find up-to-date information from the internet,
@@ -27,13 +30,22 @@ def web_search(query: str) -> str:
         A formatted string containing search results with titles, snippets, and URLs
     """
     try:
-        client = _get_tavily_client()
-        response = client.search(query=query, max_results=5, search_depth="basic")
+        cached: str | None = _search_cache.get(query)
+        if cached is not None:
+            return cached
+
+        client = get_tavily_client()
+        response = await asyncio.wait_for(
+            client.search(query=query, max_results=5, search_depth="basic"),
+            timeout=_SEARCH_TIMEOUT_SECONDS,
+        )
 
         # Extract results from response
         results = response.get("results", [])
         if not results:
-            return "No search results found for the query."
+            output = "No search results found for the query."
+            _search_cache.set(query, output, ttl=_EMPTY_RESULT_TTL)
+            return output
 
         formatted_results = []
         for i, result in enumerate(results, 1):
@@ -42,8 +54,12 @@ def web_search(query: str) -> str:
             url = result.get("url", "")
             formatted_results.append(f"{i}. {title}\n   {content}\n   URL: {url}")
 
-        return "\n\n".join(formatted_results)
+        output = "\n\n".join(formatted_results)
+        _search_cache.set(query, output)
+        return output
 
+    except TimeoutError:
+        return "Error: Web search timed out. Please try again."
     except Exception as e:
         error_msg = str(e).lower()
         if "api key" in error_msg or "authentication" in error_msg:
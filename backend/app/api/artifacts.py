@@ -1,8 +1,10 @@
 """Artifacts API endpoints."""
 
+import re
+from functools import lru_cache
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
 
 from app.models.artifact import Artifact, ArtifactSummary
@@ -11,6 +13,69 @@ from app.services.artifact_service import artifact_service
 
 router = APIRouter(prefix="/sessions/{session_id}/artifacts", tags=["Artifacts"])
 
+# Download file extension by artifact type
+_EXTENSION_MAP: dict[ArtifactType, str] = {
+    ArtifactType.DOCUMENT: ".md",
+    ArtifactType.NOTE: ".txt",
+    ArtifactType.SUMMARY: ".md",
+    ArtifactType.PLAN: ".md",
+    ArtifactType.OTHER: ".txt",
+}
+
+# Anything other than letters, digits, spaces, hyphens and underscores.
+# \w matches exactly the characters where str.isalnum() is true, plus "_".
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+
+# Artifacts are immutable once written, so clients may reuse cached copies
+_CACHE_CONTROL = "private, max-age=3600"
+
+
+def _artifact_etag(artifact_id: UUID) -> str:
+    """Build the ETag for an artifact (content never changes after creation)."""
+    return f'"{artifact_id}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+async def _not_modified(
+    request: Request, session_id: UUID, artifact_id: UUID
+) -> Response | None:
+    """Return a 304 response if the client already has this artifact.
+
+    Only the artifact summary (without content) is fetched to confirm the
+    artifact still exists in the session.
+    """
+    etag = _artifact_etag(artifact_id)
+    if not _etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+
+    summary = await artifact_service.get_summary(artifact_id)
+    if not summary or summary.session_id != session_id:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL},
+    )
+
+
+@lru_cache(maxsize=1024)
+def _download_filename(name: str, extension: str) -> str:
+    """Build a download filename from an artifact name (sanitized for safety)."""
+    safe_name = _UNSAFE_FILENAME_CHARS.sub("", name).strip()
+    return f"{safe_name}{extension}" if safe_name else f"artifact{extension}"
+
 
 @router.get("")
 async def list_artifacts(
@@ -25,9 +90,15 @@ async def list_artifacts(
     return {"artifacts": artifacts}
 
 
-@router.get("/{artifact_id}")
-async def get_artifact(session_id: UUID, artifact_id: UUID) -> Artifact:
+@router.get("/{artifact_id}", response_model=Artifact)
+async def get_artifact(
+    session_id: UUID, artifact_id: UUID, request: Request, response: Response
+) -> Artifact | Response:
     """Get a single artifact with full content."""
+    not_modified = await _not_modified(request, session_id, artifact_id)
+    if not_modified:
+        return not_modified
+
     artifact = await artifact_service.get(artifact_id)
     if not artifact:
         raise HTTPException(status_code=404, detail="Artifact not found")
@@ -36,12 +107,20 @@ async def get_artifact(session_id: UUID, artifact_id: UUID) -> Artifact:
     if artifact.session_id != session_id:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
+    response.headers["ETag"] = _artifact_etag(artifact_id)
+    response.headers["Cache-Control"] = _CACHE_CONTROL
     return artifact
 
 
 @router.get("/{artifact_id}/download")
-async def download_artifact(session_id: UUID, artifact_id: UUID) -> Response:
+async def download_artifact(
+    session_id: UUID, artifact_id: UUID, request: Request
+) -> Response:
     """Download an artifact as a file."""
+    not_modified = await _not_modified(request, session_id, artifact_id)
+    if not_modified:
+        return not_modified
+
     artifact = await artifact_service.get(artifact_id)
     if not artifact:
         raise HTTPException(status_code=404, detail="Artifact not found")
@@ -50,25 +129,16 @@ async def download_artifact(session_id: UUID, artifact_id: UUID) -> Response:
     if artifact.session_id != session_id:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    # Determine file extension based on type
-    extension_map = {
-        ArtifactType.DOCUMENT: ".md",
-        ArtifactType.NOTE: ".txt",
-        ArtifactType.SUMMARY: ".md",
-        ArtifactType.PLAN: ".md",
-        ArtifactType.OTHER: ".txt",
-    }
-    extension = extension_map.get(artifact.type, ".txt")
-
-    # Create filename from artifact name (sanitize for safety)
-    safe_name = "".join(c for c in artifact.name if c.isalnum() or c in " -_").strip()
-    filename = f"{safe_name}{extension}" if safe_name else f"artifact{extension}"
+    extension = _EXTENSION_MAP.get(artifact.type, ".txt")
+    filename = _download_filename(artifact.name, extension)
 
     return Response(
         content=artifact.content,
         media_type="text/plain; charset=utf-8",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
+            "ETag": _artifact_etag(artifact_id),
+            "Cache-Control": _CACHE_CONTROL,
         },
     )
 
@@ -1,20 +1,23 @@
 """Chat API endpoint with SSE streaming."""
 
-import json
 from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from app.models.base import SessionStatus
+from app.api.sse import coalesce_content, sse_event, sse_frame, sse_response
+from app.models.task import Task
 from app.services.agent_service import agent_service
 from app.services.session_service import session_service
 from app.services.task_service import task_service
 
 router = APIRouter(prefix="/sessions", tags=["Messages"])
 
+# Serializes the task list for tasks_updated frames in one pass
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])
+
 
 class ChatRequest(BaseModel):
     """Chat message request body."""
@@ -28,23 +31,20 @@ async def chat(session_id: UUID, request: ChatRequest) -> StreamingResponse:
 
     Messages are stored via LangGraph checkpointer, not in a separate table.
     """
-    # Verify session exists
-    session = await session_service.get(session_id)
+    # Check the session and set its title from the first message in one query
+    session = await session_service.begin_chat(session_id, request.message)
     if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+        # Only the rejected path pays for a second lookup to pick the error
+        existing = await session_service.get(session_id)
+        if not existing:
+            raise HTTPException(status_code=404, detail="Session not found")
 
-    # Block chat on completed sessions
-    if session.status == SessionStatus.COMPLETED:
+        # Block chat on completed sessions
         raise HTTPException(
             status_code=400, detail="Session is completed and cannot be modified"
         )
 
-    # Update session title if it's the first message
-    if session.title == "New Session":
-        title = request.message[:200] if len(request.message) > 200 else request.message
-        await session_service.update_title(session_id, title)
-
-    async def event_stream() -> AsyncIterator[str]:
+    async def event_stream() -> AsyncIterator[bytes]:
         """Generate SSE events from agent.
 
         Event flow (new):
@@ -54,47 +54,45 @@ async def chat(session_id: UUID, request: ChatRequest) -> StreamingResponse:
         4. done → Signal completion
         """
         try:
-            async for event in agent_service.chat(session_id, request.message):
+            async for event in coalesce_content(
+                agent_service.chat(session_id, request.message)
+            ):
                 event_type = event.get("type")
 
                 if event_type == "tasks_extracting":
-                    yield f"event: tasks_extracting\ndata: {json.dumps(event)}\n\n"
+                    yield sse_event("tasks_extracting", event)
 
                 elif event_type == "tasks_updated":
                     # Save tasks immediately BEFORE chat response streams
                     # This ensures tasks appear in the panel before the message
                     tasks = event.get("tasks", [])
                     if tasks:
-                        # Delete existing tasks first
-                        await task_service.delete_by_session(session_id)
-
-                        # Create new tasks
+                        # Replace existing tasks in a single transaction
                         task_creates = agent_service.tasks_to_create_models(
                             session_id, tasks
                         )
-                        created_tasks = await task_service.create_many(task_creates)
+                        created_tasks = await task_service.replace_by_session(
+                            session_id, task_creates
+                        )
 
                         # Send tasks with database IDs
-                        yield f"event: tasks_updated\ndata: {json.dumps({'type': 'tasks_updated', 'tasks': [t.model_dump(mode='json') for t in created_tasks]})}\n\n"
+                        yield sse_frame(
+                            "tasks_updated",
+                            b'{"type":"tasks_updated","tasks":'
+                            + _TASK_LIST_ADAPTER.dump_json(created_tasks)
+                            + b"}",
+                        )
 
                 elif event_type == "content":
-                    yield f"event: content\ndata: {json.dumps(event)}\n\n"
+                    yield sse_event("content", event)
 
                 elif event_type == "error":
-                    yield f"event: error\ndata: {json.dumps(event)}\n\n"
+                    yield sse_event("error", event)
 
                 elif event_type == "done":
-                    yield f"event: done\ndata: {json.dumps({'type': 'done'})}\n\n"
+                    yield sse_event("done", {"type": "done"})
 
         except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
-
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+            yield sse_event("error", {"type": "error", "error": str(e)})
+
+    return sse_response(event_stream())
@@ -1,26 +1,32 @@
 """Execution API endpoint with SSE streaming."""
 
 import asyncio
-import json
 import logging
+import random
+import time
 from collections.abc import AsyncIterator
+from contextvars import copy_context
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Annotated, Any
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 from app.agent.execution_graph import (
     create_execution_summary,
     execute_single_task,
-    get_execution_graph_builder,
 )
-from app.models.base import SessionStatus
+from app.api.sse import coalesce_content, sse_event, sse_frame, sse_response
+from app.models.base import SessionStatus, TaskStatus
 from app.models.execution_log import ExecutionLogsResponse
 from app.services.agent_service import agent_service
+from app.services.artifact_loader import use_artifact_loader
 from app.services.execution_connection_service import execution_connection_service
+from app.services.execution_log_buffer import ExecutionLogBuffer
 from app.services.execution_log_service import execution_log_service
 from app.services.session_service import session_service
 from app.services.task_service import task_service
@@ -42,20 +48,72 @@ router = APIRouter(prefix="/sessions", tags=["Execution"])
 
 logger = logging.getLogger("uvicorn.error")
 
-# Event types that should NOT be persisted (streaming tokens)
-_SKIP_PERSIST_EVENTS = {"content"}
+# Minimum time between connection status checks while a task is streaming
+_CONNECTION_CHECK_INTERVAL_SECONDS = 2.0
+_CONNECTION_CHECK_JITTER_SECONDS = 0.25
 
+# Session statuses execution can start or resume from
+_EXECUTABLE_STATUSES = frozenset({SessionStatus.PLANNING, SessionStatus.PAUSED})
 
-async def _persist_and_yield_event(
-    session_id: UUID, event_type: str, event: dict[str, Any]
-) -> str:
-    """Persist event to database and return SSE formatted string.
+# Connection event JSON up to the connection ID, which is always a plain UUID
+_CONNECTION_PAYLOAD_PREFIX = b'{"type":"connection","connectionId":"'
 
-    Skips persisting streaming content tokens as they add no value on reload.
+
+@lru_cache(maxsize=1)
+def _format_start_minute(minute: int) -> str:
+    """Format a Unix time in whole minutes as execution start time text."""
+    return datetime.fromtimestamp(minute * 60, UTC).strftime(
+        "%A, %B %d, %Y at %H:%M UTC"
+    )
+
+
+def _execution_start_time() -> str:
+    """Get the current UTC time as execution start time text.
+
+    The text has minute precision, so it is formatted at most once a minute.
+    """
+    return _format_start_minute(int(time.time()) // 60)
+
+
+def _next_connection_check() -> float:
+    """Get the monotonic time at which to poll the connection status next.
+
+    Jitter keeps concurrent executions from polling in lockstep.
     """
-    if event_type not in _SKIP_PERSIST_EVENTS:
-        await execution_log_service.create_from_event(session_id, event)
-    return _sse_event(event_type, event)
+    return (
+        time.monotonic()
+        + _CONNECTION_CHECK_INTERVAL_SECONDS
+        + random.uniform(0, _CONNECTION_CHECK_JITTER_SECONDS)
+    )
+
+
+def _persist_and_yield_event(
+    log_buffer: ExecutionLogBuffer, event_type: str, event: dict[str, Any]
+) -> bytes:
+    """Queue event for persistence and return the encoded SSE frame.
+
+    Streaming content tokens never come through here: they add no value on
+    reload, so the stream forwards them directly.
+    """
+    log_buffer.add(event)
+    return sse_event(event_type, event)
+
+
+async def _pause_session(
+    session_id: UUID, log_buffer: ExecutionLogBuffer, reason: str | None
+) -> dict[str, Any]:
+    """Pause the session and queue the paused event for persistence.
+
+    Only the status update is awaited; the log buffer writes the event in
+    the background, so pausing costs a single round-trip.
+
+    Returns:
+        The paused event
+    """
+    await session_service.update_status(session_id, SessionStatus.PAUSED)
+    event = {"type": "paused", "reason": reason}
+    log_buffer.add(event)
+    return event
 
 
 @router.post("/{session_id}/execute")
@@ -75,60 +133,51 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
     - error: When an error occurs
     - done: When all tasks are processed
     """
-    # Verify session exists
-    session = await session_service.get(session_id)
-    if not session:
+    # Check the session, load its tasks, set it executing and register this
+    # execution connection (invalidating any previous one) in one query
+    started = await session_service.begin_execution(session_id)
+    if not started:
         raise HTTPException(status_code=404, detail="Session not found")
-
-    # Only allow execution from planning or paused states
-    if session.status not in [SessionStatus.PLANNING, SessionStatus.PAUSED]:
-        if session.status == SessionStatus.COMPLETED:
-            raise HTTPException(status_code=400, detail="Session is already completed")
+    session, tasks_to_execute, connection_id = started
+
+    if connection_id is None:
+        # Only allow execution from planning or paused states
+        if session.status not in _EXECUTABLE_STATUSES:
+            if session.status == SessionStatus.COMPLETED:
+                raise HTTPException(
+                    status_code=400, detail="Session is already completed"
+                )
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot execute session in {session.status.value} state",
+            )
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot execute session in {session.status.value} state",
+            detail="No tasks to execute",
         )
 
-    is_resuming = session.status == SessionStatus.PAUSED
+    # Interrupted tasks are only returned when resuming a paused session
+    is_resuming = any(t.status == TaskStatus.IN_PROGRESS for t in tasks_to_execute)
     logger.info(
         f"[EXECUTE] Starting execution for session {session_id} (resuming={is_resuming})"
     )
 
-    # Get tasks based on session state
-    if is_resuming:
-        tasks_to_execute = await task_service.get_resumable_tasks(session_id)
-    else:
-        tasks_to_execute = await task_service.get_pending_tasks(session_id)
-
-    if not tasks_to_execute:
-        raise HTTPException(
-            status_code=400,
-            detail="No tasks to execute",
-        )
-
-    # Update session status to executing
-    await session_service.update_status(session_id, SessionStatus.EXECUTING)
-
-    # Register this execution connection - invalidates any previous connection
-    connection_id = await execution_connection_service.register_connection(session_id)
-
-    async def event_stream() -> AsyncIterator[str]:
+    async def event_stream() -> AsyncIterator[bytes]:
         """Generate SSE events from task execution."""
         # Capture execution start time for consistent date context across all tasks
-        execution_start_time = datetime.now(UTC).strftime("%A, %B %d, %Y at %H:%M UTC")
+        execution_start_time = _execution_start_time()
+
+        # Execution log events are written by a background task
+        log_buffer = ExecutionLogBuffer(session_id)
 
         # Emit connection event so frontend can start sending heartbeats
-        yield _sse_event(
-            "connection", {"type": "connection", "connectionId": str(connection_id)}
+        yield sse_frame(
+            "connection",
+            _CONNECTION_PAYLOAD_PREFIX + str(connection_id).encode() + b'"}',
         )
 
-        # Initialize agent service if needed
-        if not agent_service._initialized:
-            await agent_service.initialize()
-
-        # Get the execution graph
-        graph_builder = get_execution_graph_builder()
-        graph = graph_builder.compile(checkpointer=agent_service._checkpointer)
+        # Get the execution graph (compiled once at startup)
+        graph = await agent_service.get_execution_graph()
 
         completed_count = 0
         failed_count = 0
@@ -136,6 +185,7 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
 
         # Track completed task results for context passing
         completed_task_results: list[dict[str, Any]] = []
+        session_completed = False
 
         try:
             for task in tasks_to_execute:
@@ -147,14 +197,10 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
                     session_id, connection_id, timeout_seconds=15
                 )
                 if not is_active:
-                    await session_service.update_status(
-                        session_id, SessionStatus.PAUSED
+                    pause_event = await _pause_session(
+                        session_id, log_buffer, pause_reason
                     )
-                    pause_event = {"type": "paused", "reason": pause_reason}
-                    await execution_log_service.create_from_event(
-                        session_id, pause_event
-                    )
-                    yield _sse_event("paused", pause_event)
+                    yield sse_event("paused", pause_event)
                     return  # Exit the generator
 
                 task_id = str(task.id)
@@ -166,14 +212,14 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
 
                 # Emit task_selected event
                 event = {"type": "task_selected", "taskId": task_id}
-                yield await _persist_and_yield_event(session_id, "task_selected", event)
+                yield _persist_and_yield_event(log_buffer, "task_selected", event)
 
                 # Start the task in database
                 try:
                     await task_service.start_task(task.id)
                 except ValueError as e:
                     event = {"type": "error", "taskId": task_id, "error": str(e)}
-                    yield await _persist_and_yield_event(session_id, "error", event)
+                    yield _persist_and_yield_event(log_buffer, "error", event)
                     failed_count += 1
                     continue
 
@@ -194,15 +240,27 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
                 # Pausing between tool_call and tool_result corrupts LangGraph state
                 pending_tool_calls = 0
 
+                # Poll the connection at most every couple of seconds, not per token
+                next_connection_check = time.monotonic()
+
+                # Batch and cache read_artifact lookups made while running this
+                # task. The task's stream runs in its own copy of the context,
+                # so the loader is dropped with it and never reset from here.
+                task_context = copy_context()
+                task_context.run(use_artifact_loader)
+
                 # Execute the task and stream events, passing previous results for context
                 try:
-                    async for event in execute_single_task(
-                        graph,
-                        session_id,
-                        task_dict,
-                        config,
-                        completed_task_results,
-                        execution_start_time,
+                    async for event in coalesce_content(
+                        execute_single_task(
+                            graph,
+                            session_id,
+                            task_dict,
+                            config,
+                            completed_task_results,
+                            execution_start_time,
+                        ),
+                        context=task_context,
                     ):
                         event_type = event.get("type")
 
@@ -216,55 +274,56 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
                         # Pausing between tool_call and tool_result corrupts the
                         # message history and causes "tool_call_ids did not have
                         # response messages" error on resume
-                        if pending_tool_calls == 0:
+                        if (
+                            pending_tool_calls == 0
+                            and time.monotonic() >= next_connection_check
+                        ):
                             (
                                 is_active,
                                 pause_reason,
                             ) = await execution_connection_service.check_connection_status(
                                 session_id, connection_id, timeout_seconds=15
                             )
+                            next_connection_check = _next_connection_check()
                             if not is_active:
                                 logger.info(
                                     f"[EXECUTE] Connection inactive during task (reason={pause_reason}), pausing session {session_id}"
                                 )
-                                await session_service.update_status(
-                                    session_id, SessionStatus.PAUSED
-                                )
-                                pause_event = {
-                                    "type": "paused",
-                                    "reason": pause_reason,
-                                }
-                                await execution_log_service.create_from_event(
-                                    session_id, pause_event
+                                pause_event = await _pause_session(
+                                    session_id, log_buffer, pause_reason
                                 )
-                                yield _sse_event("paused", pause_event)
+                                yield sse_event("paused", pause_event)
                                 return  # Exit the generator
 
+                        # Streaming tokens are forwarded without persisting
+                        if event_type == "content":
+                            yield sse_event("content", event)
+
                         # Track completion info
-                        if event_type == "task_completed":
+                        elif event_type == "task_completed":
                             task_result = event.get("result", "Task completed")
-                            yield await _persist_and_yield_event(
-                                session_id, event_type, event
+                            yield _persist_and_yield_event(
+                                log_buffer, event_type, event
                             )
 
                         elif event_type == "error":
                             task_failed = True
                             error_message = event.get("error", "Unknown error")
-                            yield await _persist_and_yield_event(
-                                session_id, event_type, event
+                            yield _persist_and_yield_event(
+                                log_buffer, event_type, event
                             )
 
                         elif event_type:
-                            # Forward other events (tool_call, tool_result, content, artifact_*)
-                            yield await _persist_and_yield_event(
-                                session_id, event_type, event
+                            # Forward other events (tool_call, tool_result, artifact_*)
+                            yield _persist_and_yield_event(
+                                log_buffer, event_type, event
                             )
 
                 except Exception as e:
                     task_failed = True
                     error_message = str(e)
                     event = {"type": "error", "taskId": task_id, "error": error_message}
-                    yield await _persist_and_yield_event(session_id, "error", event)
+                    yield _persist_and_yield_event(log_buffer, "error", event)
 
                 # Update task in database
                 try:
@@ -295,10 +354,11 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
                         "taskId": task_id,
                         "error": f"Failed to update task status: {e}",
                     }
-                    yield await _persist_and_yield_event(session_id, "error", event)
+                    yield _persist_and_yield_event(log_buffer, "error", event)
 
             # Update session status to completed
             await session_service.update_status(session_id, SessionStatus.COMPLETED)
+            session_completed = True
 
             # Clear connection record since execution completed normally
             await execution_connection_service.clear_connection(session_id)
@@ -312,53 +372,40 @@ async def execute_tasks(session_id: UUID, request: Request) -> StreamingResponse
                     "failed": failed_count,
                 },
             }
-            yield await _persist_and_yield_event(session_id, "done", done_event)
+            yield _persist_and_yield_event(log_buffer, "done", done_event)
 
         except asyncio.CancelledError:
             # Client disconnected - pause execution
             logger.info(
                 f"[EXECUTE] CancelledError caught, pausing session {session_id}"
             )
-            await session_service.update_status(session_id, SessionStatus.PAUSED)
-            event = {"type": "paused", "reason": "client_disconnected"}
-            await execution_log_service.create_from_event(session_id, event)
+            if not session_completed:
+                await _pause_session(session_id, log_buffer, "client_disconnected")
             raise  # Re-raise to properly close the generator
 
         except GeneratorExit:
             # Generator closed (client disconnected)
             logger.info(f"[EXECUTE] GeneratorExit caught, pausing session {session_id}")
-            await session_service.update_status(session_id, SessionStatus.PAUSED)
-            event = {"type": "paused", "reason": "client_disconnected"}
-            await execution_log_service.create_from_event(session_id, event)
+            if not session_completed:
+                await _pause_session(session_id, log_buffer, "client_disconnected")
             raise  # Re-raise to properly close the generator
 
         except Exception as e:
             logger.error(f"[EXECUTE] Exception caught: {type(e).__name__}: {e}")
             event = {"type": "error", "error": str(e)}
-            yield await _persist_and_yield_event(session_id, "error", event)
-
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+            yield _persist_and_yield_event(log_buffer, "error", event)
 
+            # Don't leave the session stuck in executing; pausing lets the
+            # user continue from the interrupted task
+            if not session_completed:
+                pause_event = await _pause_session(session_id, log_buffer, "error")
+                yield sse_event("paused", pause_event)
 
-def _sse_event(event_type: str, data: dict[str, Any]) -> str:
-    """Format a dict as an SSE event string.
+        finally:
+            # Write out queued events on every exit path, including disconnects
+            await log_buffer.close()
 
-    Args:
-        event_type: The SSE event name
-        data: The data to serialize as JSON
-
-    Returns:
-        Formatted SSE event string
-    """
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+    return sse_response(event_stream())
 
 
 class ClaimResponse(BaseModel):
@@ -384,24 +431,19 @@ async def claim_execution(session_id: UUID) -> ClaimResponse:
     This immediately supersedes any previous connection and pauses the session,
     so the user sees "paused" status and can click Continue.
     """
-    session = await session_service.get(session_id)
-    if not session:
+    # Pause and register the new connection in one query
+    claim = await session_service.claim_execution(session_id)
+    if not claim:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    if session.status != SessionStatus.EXECUTING:
+    session, new_connection_id = claim
+    if new_connection_id is None:
         # Not executing, nothing to claim
         return ClaimResponse(
             claimed=False, status=session.status.value, connection_id=None
         )
 
-    # Register new connection (supersedes old one)
-    new_connection_id = await execution_connection_service.register_connection(
-        session_id
-    )
-
-    # Immediately pause - the old execution will detect this on its next check
-    await session_service.update_status(session_id, SessionStatus.PAUSED)
-
+    # The old execution detects the superseded connection on its next check
     return ClaimResponse(
         claimed=True, status="paused", connection_id=str(new_connection_id)
     )
@@ -437,25 +479,17 @@ async def pause_execution(session_id: UUID) -> PauseResponse:
     loop will detect on its next checkpoint. The actual pause happens
     asynchronously and the frontend will receive a "paused" SSE event.
     """
-    session = await session_service.get(session_id)
-    if not session:
+    # Check the session is executing and set the pause flag in one query
+    outcome = await execution_connection_service.request_pause(session_id)
+    if outcome is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    if session.status != SessionStatus.EXECUTING:
-        return PauseResponse(paused=False, status=session.status.value)
-
-    # Request pause via connection service
-    success = await execution_connection_service.request_pause(session_id)
-
-    if success:
+    paused, status = outcome
+    if paused:
         return PauseResponse(paused=True, status="pausing")
-    else:
-        # No active connection - execution may have just completed
-        # Refresh session status
-        session = await session_service.get(session_id)
-        return PauseResponse(
-            paused=False, status=session.status.value if session else "unknown"
-        )
+
+    # Not executing, or no active connection (execution may have just completed)
+    return PauseResponse(paused=False, status=status)
 
 
 @router.post("/{session_id}/summarize")
@@ -476,25 +510,20 @@ async def summarize_session(session_id: UUID) -> StreamingResponse:
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Get completed tasks
-    tasks = await task_service.list_by_session(session_id)
-    completed_tasks = [t for t in tasks if t.status.value == "done"]
-
-    if not completed_tasks:
+    # Get completed task results and counts
+    summary = await task_service.get_results_summary(session_id)
+    if not summary.completed:
         raise HTTPException(
             status_code=400,
             detail="No completed tasks to summarize",
         )
 
-    # Build task results
-    task_results = [
-        {"title": t.title, "result": t.result or "Completed"} for t in completed_tasks
-    ]
-    total = len(tasks)
-    completed = len(completed_tasks)
-    failed = len([t for t in tasks if t.status.value == "failed"])
+    task_results = summary.task_results
+    total = summary.total
+    completed = summary.completed
+    failed = summary.failed
 
-    async def event_stream() -> AsyncIterator[str]:
+    async def event_stream() -> AsyncIterator[bytes]:
         """Generate SSE events for summary."""
         try:
             # First create the summary artifact
@@ -509,7 +538,7 @@ async def summarize_session(session_id: UUID) -> StreamingResponse:
             if summary_result:
                 # Emit artifact_created event
                 artifact = summary_result["artifact"]
-                yield _sse_event(
+                yield sse_event(
                     "artifact_created",
                     {
                         "type": "artifact_created",
@@ -521,54 +550,57 @@ async def summarize_session(session_id: UUID) -> StreamingResponse:
                 )
 
             # Stream execution summary as chat message
-            async for event in agent_service.summarize_execution(
-                session_id=session_id,
-                task_results=task_results,
-                total=total,
-                completed=completed,
-                failed=failed,
+            async for event in coalesce_content(
+                agent_service.summarize_execution(
+                    session_id=session_id,
+                    task_results=task_results,
+                    total=total,
+                    completed=completed,
+                    failed=failed,
+                )
             ):
                 event_type = event.get("type")
                 if event_type == "content":
-                    yield _sse_event("content", event)
+                    yield sse_event("content", event)
                 elif event_type == "error":
-                    yield _sse_event("error", event)
+                    yield sse_event("error", event)
                 elif event_type == "done":
-                    yield _sse_event("done", {"type": "done"})
+                    yield sse_event("done", {"type": "done"})
 
         except Exception as e:
-            yield _sse_event("error", {"type": "error", "error": str(e)})
-
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+            yield sse_event("error", {"type": "error", "error": str(e)})
+
+    return sse_response(event_stream())
 
 
-@router.get("/{session_id}/execution-logs")
+@router.get("/{session_id}/execution-logs", response_model=ExecutionLogsResponse)
 async def get_execution_logs(
     session_id: UUID,
     limit: Annotated[int, Query(ge=1, le=5000)] = 1000,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> ExecutionLogsResponse:
+) -> Response:
     """Get execution logs for a session.
 
     Returns all execution events that were generated during task execution.
     Used to restore the execution log view when reloading a session.
+
+    Rows come back from the database already in the ExecutionLogsResponse
+    shape and are encoded directly, skipping per-log model validation.
     """
     # Verify session exists
     session = await session_service.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    logs = await execution_log_service.list_by_session(
-        session_id, limit=limit, offset=offset
+    # The page and the total are independent queries, so run them together
+    logs, total = await asyncio.gather(
+        execution_log_service.list_api_rows_by_session(
+            session_id, limit=limit, offset=offset
+        ),
+        execution_log_service.count_by_session(session_id),
     )
-    total = await execution_log_service.count_by_session(session_id)
 
-    return ExecutionLogsResponse(logs=logs, total=total)
+    return Response(
+        content=orjson.dumps({"logs": logs, "total": total}),
+        media_type="application/json",
+    )
@@ -1,16 +1,28 @@
 """Health check endpoint."""
 
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from fastapi import APIRouter
 
 router = APIRouter(tags=["Health"])
 
 
+@lru_cache(maxsize=1)
+def _format_timestamp(second: int) -> str:
+    """Format a Unix time in whole seconds as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(second, UTC).isoformat()
+
+
 @router.get("/health")
 async def health_check() -> dict[str, str]:
-    """Health check endpoint."""
+    """Health check endpoint.
+
+    The timestamp has second precision, so frequent load balancer polls
+    reuse the same formatted string.
+    """
     return {
         "status": "healthy",
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": _format_timestamp(int(time.time())),
     }
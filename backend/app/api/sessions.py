@@ -4,6 +4,7 @@ from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 
 from app.models.base import SessionStatus
 from app.models.session import Session, SessionDetail
@@ -33,13 +34,20 @@ async def create_session() -> Session:
     return await session_service.create()
 
 
-@router.get("/{session_id}")
-async def get_session(session_id: UUID) -> SessionDetail:
-    """Get session details with all related data."""
+@router.get("/{session_id}", response_model=SessionDetail)
+async def get_session(session_id: UUID) -> Response:
+    """Get session details with all related data.
+
+    The detail is already a validated model, so it is dumped to JSON once
+    by pydantic instead of being re-validated and encoded by FastAPI.
+    """
     session = await session_service.get_detail(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    return session
+    return Response(
+        content=session.model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
 
 
 @router.delete("/{session_id}", status_code=204)
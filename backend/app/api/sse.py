@@ -0,0 +1,213 @@
+"""Server-Sent Events helpers shared by the streaming endpoints."""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from contextvars import Context
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+# Headers for SSE responses (X-Accel-Buffering disables proxy buffering)
+SSE_HEADERS: dict[str, str] = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# Idle time after which a comment frame is sent so proxies keep the
+# connection open during long LLM generations or tool calls
+KEEPALIVE_INTERVAL_SECONDS = 15.0
+KEEPALIVE_FRAME = b": ping\n\n"
+
+# Frames the source stream may run ahead of a slow client before it waits,
+# so agent execution isn't stalled by client write speed
+STREAM_BUFFER_FRAMES = 256
+
+# Streamed tokens arriving within this long of the last content event sent
+# are merged into one event, up to a cap, to cut per-token frames and writes
+CONTENT_FLUSH_INTERVAL_SECONDS = 0.016
+CONTENT_FLUSH_MAX_CHUNKS = 32
+
+_FRAME_END = b"\n\n"
+
+_STREAM_END = object()
+
+# Producers still cleaning up after cancellation, kept referenced until done
+_closing_producers: set[asyncio.Task[None]] = set()
+
+
+@lru_cache(maxsize=64)
+def _frame_prefix(event_type: str) -> bytes:
+    """Get the encoded event and data line prefix for an event type."""
+    return f"event: {event_type}\ndata: ".encode()
+
+
+def sse_event(event_type: str, data: dict[str, Any]) -> bytes:
+    """Format a dict as an encoded SSE event frame.
+
+    Args:
+        event_type: The SSE event name
+        data: The data to serialize as JSON
+
+    Returns:
+        Formatted SSE event frame, ready to write to the response
+    """
+    try:
+        payload = orjson.dumps(data)
+    except orjson.JSONEncodeError:
+        # orjson rejects some values json accepts (e.g. integers over 64 bits)
+        payload = json.dumps(data, separators=(",", ":")).encode()
+    return sse_frame(event_type, payload)
+
+
+def sse_frame(event_type: str, payload: bytes) -> bytes:
+    """Build an SSE event frame around an already-encoded JSON payload."""
+    return _frame_prefix(event_type) + payload + _FRAME_END
+
+
+def _start_producer(
+    stream: AsyncIterator[Any],
+    queue: asyncio.Queue[Any],
+    context: Context | None = None,
+) -> asyncio.Task[None]:
+    """Consume a stream into a queue from a single task.
+
+    The stream keeps one context throughout: the given one, or a copy of
+    the current context. The queue receives each item, then either
+    _STREAM_END or the exception the stream raised.
+    """
+
+    async def produce() -> None:
+        try:
+            async for item in stream:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    return asyncio.create_task(produce(), context=context)
+
+
+def _stop_producer(producer: asyncio.Task[None]) -> None:
+    """Cancel a producer, keeping it referenced until its cleanup finishes."""
+    if not producer.done():
+        producer.cancel()
+        _closing_producers.add(producer)
+        producer.add_done_callback(_closing_producers.discard)
+
+
+async def coalesce_content(
+    events: AsyncIterator[dict[str, Any]],
+    interval: float = CONTENT_FLUSH_INTERVAL_SECONDS,
+    context: Context | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Merge content events that arrive in quick succession.
+
+    The first token after a quiet period is sent immediately. Tokens that
+    follow within the interval are held and sent as one content event when
+    the interval runs out, even if the source stalls, when
+    CONTENT_FLUSH_MAX_CHUNKS are held, or when any other event arrives
+    (held tokens always go out before it).
+
+    The source is consumed by a producer task at most one event ahead,
+    running in context if given. Closing or cancelling this generator
+    cancels the producer, which raises CancelledError inside the source.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=1)
+    pending: list[dict[str, Any]] = []
+    flushed_at = -interval
+
+    def merged() -> dict[str, Any]:
+        flushed = (
+            pending[0]
+            if len(pending) == 1
+            else {**pending[0], "content": "".join(e["content"] for e in pending)}
+        )
+        pending.clear()
+        return flushed
+
+    producer = _start_producer(events, queue, context)
+    try:
+        while True:
+            if pending:
+                deadline = flushed_at + interval
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=deadline - time.monotonic()
+                    )
+                except TimeoutError:
+                    flushed_at = time.monotonic()
+                    yield merged()
+                    continue
+            else:
+                item = await queue.get()
+
+            if item is _STREAM_END or isinstance(item, Exception):
+                if pending:
+                    yield merged()
+                if isinstance(item, Exception):
+                    raise item
+                return
+
+            if item.get("type") == "content" and isinstance(item.get("content"), str):
+                pending.append(item)
+                now = time.monotonic()
+                if (
+                    now - flushed_at < interval
+                    and len(pending) < CONTENT_FLUSH_MAX_CHUNKS
+                ):
+                    continue
+                flushed_at = now
+                yield merged()
+                continue
+
+            if pending:
+                yield merged()
+            yield item
+    finally:
+        _stop_producer(producer)
+
+
+async def with_keepalive(
+    stream: AsyncIterator[bytes],
+    interval: float = KEEPALIVE_INTERVAL_SECONDS,
+) -> AsyncIterator[bytes]:
+    """Interleave keepalive comment frames into an SSE stream when idle.
+
+    The source stream is consumed by a single producer task, so it keeps one
+    context throughout and is never cancelled by an idle timeout. The
+    producer buffers up to STREAM_BUFFER_FRAMES frames ahead of the client.
+    Closing or cancelling this generator cancels the producer, which raises
+    CancelledError inside the source stream as a client disconnect would.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=STREAM_BUFFER_FRAMES)
+    producer = _start_producer(stream, queue)
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=interval)
+            except TimeoutError:
+                yield KEEPALIVE_FRAME
+                continue
+
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        _stop_producer(producer)
+
+
+def sse_response(stream: AsyncIterator[bytes]) -> StreamingResponse:
+    """Wrap an SSE event stream in a streaming response with keepalives."""
+    return StreamingResponse(
+        with_keepalive(stream),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
@@ -14,6 +14,14 @@ class Settings(BaseSettings):
     database_url: str = Field(..., validation_alias="DATABASE_URL")
     supabase_url: str = Field(..., validation_alias="SUPABASE_URL")
     supabase_key: str = Field(..., validation_alias="SUPABASE_KEY")
+    # Whether DATABASE_URL goes through PgBouncer/Supavisor, which rules out
+    # prepared statements. Disable when it points straight at Postgres.
+    pgbouncer_enabled: bool = Field(default=True, validation_alias="PGBOUNCER_ENABLED")
+    database_pool_size: int = Field(default=50, validation_alias="DATABASE_POOL_SIZE")
+    # Seconds to wait for a free pool connection before failing the request
+    database_pool_timeout: float = Field(
+        default=5.0, validation_alias="DATABASE_POOL_TIMEOUT"
+    )
 
     # AI Services
     openai_api_key: str = Field(..., validation_alias="OPENAI_API_KEY")
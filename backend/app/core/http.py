@@ -0,0 +1,30 @@
+"""Shared HTTP client for outbound API calls."""
+
+from functools import lru_cache
+
+import httpx
+
+# Same read timeout as the OpenAI SDK default, so long generations are not
+# cut off, but fail fast rather than queue when the connection pool is full
+_TIMEOUT = httpx.Timeout(600.0, connect=5.0, pool=10.0)
+# Same limits as the OpenAI SDK default client. Each streaming generation
+# holds a connection for its whole duration, so a smaller pool would make
+# concurrent streams wait for each other.
+_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client.
+
+    Reusing one connection pool lets LLM calls skip TCP and TLS setup once
+    a connection to the provider is open.
+    """
+    return httpx.AsyncClient(timeout=_TIMEOUT, limits=_LIMITS)
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
@@ -0,0 +1,23 @@
+"""Input validation helpers."""
+
+import re
+from functools import lru_cache
+from uuid import UUID
+
+# Canonical UUID text: 32 hex digits, optionally hyphenated 8-4-4-4-12
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}(-?)[0-9a-f]{4}\1[0-9a-f]{4}\1[0-9a-f]{4}\1[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1024)
+def parse_uuid(value: str) -> UUID | None:
+    """Parse a UUID string, returning None if it is malformed.
+
+    Invalid input is rejected by a regex without raising, and parsed values
+    are cached since the same IDs recur across tool calls in a session.
+    """
+    if not _UUID_RE.fullmatch(value):
+        return None
+    return UUID(value)
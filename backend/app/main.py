@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -7,9 +8,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
+from app.core.http import close_http_client
 from app.services.agent_service import agent_service
 
 
+def _report_warmup(task: asyncio.Task[None]) -> None:
+    """Report a failed agent service warmup (requests retry initialization)."""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Agent service warmup failed: {task.exception()}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler."""
@@ -17,14 +25,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
     print(f"Starting Libra API in {settings.environment} mode")
 
-    # Initialize agent service
-    await agent_service.initialize()
+    # Warm up the agent service while the server starts accepting requests;
+    # requests that need it wait for initialization to finish
+    warmup = asyncio.create_task(agent_service.initialize())
+    warmup.add_done_callback(_report_warmup)
 
     yield
 
     # Shutdown
     print("Shutting down Libra API")
+    warmup.cancel()
+    await asyncio.gather(warmup, return_exceptions=True)
     await agent_service.close()
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
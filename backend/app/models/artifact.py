@@ -7,6 +7,22 @@ from pydantic import Field, field_validator
 
 from app.models.base import ArtifactType, BaseDBModel
 
+# Maximum artifact content size in UTF-8 bytes (100KB)
+MAX_CONTENT_BYTES = 102400
+
+
+def content_exceeds_limit(content: str) -> bool:
+    """Check whether content is over the 100KB limit once UTF-8 encoded.
+
+    A character encodes to 1-4 bytes, so the string length bounds the encoded
+    size and the content is only encoded when those bounds are inconclusive.
+    """
+    if len(content) * 4 <= MAX_CONTENT_BYTES:
+        return False
+    if len(content) > MAX_CONTENT_BYTES:
+        return True
+    return len(content.encode("utf-8")) > MAX_CONTENT_BYTES
+
 
 class ArtifactBase(BaseDBModel):
     """Base artifact model."""
@@ -19,7 +35,7 @@ class ArtifactBase(BaseDBModel):
     @classmethod
     def validate_content_size(cls, v: str) -> str:
         """Validate content size is under 100KB."""
-        if len(v.encode("utf-8")) > 102400:
+        if content_exceeds_limit(v):
             raise ValueError("Artifact content exceeds 100KB limit")
         return v
 
@@ -37,7 +53,7 @@ class ArtifactCreate(BaseDBModel):
     @classmethod
     def validate_content_size(cls, v: str) -> str:
         """Validate content size is under 100KB."""
-        if len(v.encode("utf-8")) > 102400:
+        if content_exceeds_limit(v):
             raise ValueError("Artifact content exceeds 100KB limit")
         return v
 
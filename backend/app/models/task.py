@@ -40,3 +40,12 @@ class Task(TaskBase, TimestampMixin):
     id: UUID
     session_id: UUID
     result: str | None = None
+
+
+class TaskResultsSummary(BaseDBModel):
+    """Completed task results and status counts for a session."""
+
+    task_results: list[dict[str, str]]
+    total: int
+    completed: int
+    failed: int
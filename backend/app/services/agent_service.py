@@ -1,44 +1,139 @@
 """Agent service for managing LangGraph agents with persistence."""
 
+import asyncio
 from collections.abc import AsyncIterator
 from typing import Any, cast
 from uuid import UUID
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
+from langchain_core.utils.json import parse_partial_json
 from langchain_openai import ChatOpenAI
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.graph.state import CompiledStateGraph
 from psycopg.rows import dict_row
-from psycopg_pool import AsyncNullConnectionPool
+from psycopg_pool import AsyncConnectionPool
 from pydantic import SecretStr
 
+from app.agent.execution_graph import get_execution_graph_builder
 from app.agent.graph import get_planning_graph_builder
-from app.agent.state import PlanningState
+from app.agent.state import ExecutionState, PlanningState
 from app.core.config import get_settings
+from app.core.http import get_http_client
 from app.models.task import TaskCreate
 
+# Built once so every summary request starts with the identical prompt prefix
+_SUMMARY_SYSTEM_MESSAGE = SystemMessage(
+    content="""You are summarizing the results of task execution for the user.
+
+Based on the execution results provided, give a brief, friendly summary of what was accomplished.
+
+Guidelines:
+- Be conversational and positive
+- Use bullet points for key findings and results
+- Use **bold** for important highlights
+- Mention any issues if tasks failed
+- Keep it concise (3-6 bullet points max)
+- If there are notable artifacts created, mention them
+
+Format example:
+- **Main finding**: Brief description
+- **Key result**: What was discovered/accomplished
+- Any issues or next steps
+
+Remember: The user just watched their tasks execute. Give them a scannable, helpful summary."""
+)
+
+
+def _extraction_delta(chunk: Any) -> str:
+    """Get the raw JSON text carried by a structured-output stream chunk.
+
+    Depending on the structured output method, the JSON arrives either as
+    message content or as tool call argument chunks.
+    """
+    content = getattr(chunk, "content", None)
+    if isinstance(content, str) and content:
+        return content
+    return "".join(
+        tc.get("args") or "" for tc in getattr(chunk, "tool_call_chunks", None) or []
+    )
+
+
+def _completed_task_titles(buffer: str) -> list[str]:
+    """Get the task titles that are fully streamed in a partial TaskList JSON.
+
+    A title is complete once a later task or the task's description has
+    started streaming. The last title is confirmed by tasks_updated.
+    """
+    try:
+        parsed = parse_partial_json(buffer)
+    except ValueError:
+        return []
+    if not isinstance(parsed, dict) or not isinstance(parsed.get("tasks"), list):
+        return []
+
+    tasks = [t for t in parsed["tasks"] if isinstance(t, dict)]
+    if tasks and "description" not in tasks[-1]:
+        tasks = tasks[:-1]
+    return [str(t["title"]) for t in tasks if t.get("title")]
+
 
 class AgentService:
     """Service for managing LangGraph agents with PostgreSQL persistence."""
 
-    _pool: AsyncNullConnectionPool | None = None
+    _pool: AsyncConnectionPool | None = None
     _checkpointer: AsyncPostgresSaver | None = None
+    _planning_graph: (
+        CompiledStateGraph[PlanningState, None, PlanningState, PlanningState] | None
+    ) = None
+    _execution_graph: (
+        CompiledStateGraph[ExecutionState, None, ExecutionState, ExecutionState] | None
+    ) = None
+    # Standalone streaming LLM for execution summaries
+    _summary_llm: ChatOpenAI | None = None
     _initialized: bool = False
+    # Serializes initialization between the startup warmup and requests
+    _init_lock = asyncio.Lock()
 
     async def initialize(self) -> None:
-        """Initialize the connection pool and checkpointer."""
+        """Initialize the connection pool and checkpointer.
+
+        Safe to call concurrently: callers wait for an initialization already
+        in progress instead of starting another.
+        """
         if self._initialized:
             return
+        async with self._init_lock:
+            if not self._initialized:
+                await self._open()
 
+    async def _open(self) -> None:
+        """Open the connection pool, checkpointer, graphs and summary LLM."""
         settings = get_settings()
 
-        # Use NullConnectionPool to avoid double-pooling with Supabase's PgBouncer
         # autocommit=True required for CREATE INDEX CONCURRENTLY in setup()
         # row_factory=dict_row required for checkpointer row access
-        pool = AsyncNullConnectionPool(
+        connection_kwargs: dict[str, Any] = {
+            "autocommit": True,
+            "row_factory": dict_row,
+        }
+        if settings.pgbouncer_enabled:
+            # PgBouncer/Supavisor in transaction mode may run each statement on
+            # a different server connection, so prepared statements can't be used
+            connection_kwargs["prepare_threshold"] = None
+
+        # Keep connections warm so the checkpoint reads and writes of each chat
+        # turn don't each pay a new connection handshake
+        pool = AsyncConnectionPool(
             conninfo=settings.database_url,
             open=False,
-            kwargs={"autocommit": True, "row_factory": dict_row},
+            kwargs=connection_kwargs,
+            min_size=2,
+            max_size=settings.database_pool_size,
+            timeout=settings.database_pool_timeout,
+            # Recycle connections so server-side state can't build up
+            max_lifetime=1800.0,
+            check=AsyncConnectionPool.check_connection,
         )
         await pool.open(wait=True)
         self._pool = pool
@@ -49,6 +144,20 @@ class AgentService:
         await checkpointer.setup()
         self._checkpointer = checkpointer
 
+        # Compile the graphs once; runs only differ by thread config
+        self._planning_graph = get_planning_graph_builder().compile(
+            checkpointer=checkpointer
+        )
+        self._execution_graph = get_execution_graph_builder().compile(
+            checkpointer=checkpointer
+        )
+        self._summary_llm = ChatOpenAI(
+            model="gpt-4o",
+            api_key=SecretStr(settings.openai_api_key),
+            streaming=True,
+            http_async_client=get_http_client(),
+        )
+
         self._initialized = True
 
     async def close(self) -> None:
@@ -57,8 +166,31 @@ class AgentService:
             await self._pool.close()
             self._pool = None
             self._checkpointer = None
+            self._planning_graph = None
+            self._execution_graph = None
+            self._summary_llm = None
             self._initialized = False
 
+    async def get_execution_graph(
+        self,
+    ) -> CompiledStateGraph[ExecutionState, None, ExecutionState, ExecutionState]:
+        """Get the compiled execution graph, initializing the service if needed."""
+        if self._execution_graph is None:
+            await self.initialize()
+        if self._execution_graph is None:
+            raise RuntimeError("Agent service is not initialized")
+        return self._execution_graph
+
+    async def _get_planning_graph(
+        self,
+    ) -> CompiledStateGraph[PlanningState, None, PlanningState, PlanningState]:
+        """Get the compiled planning graph, initializing the service if needed."""
+        if self._planning_graph is None:
+            await self.initialize()
+        if self._planning_graph is None:
+            raise RuntimeError("Agent service is not initialized")
+        return self._planning_graph
+
     def _get_thread_id(self, session_id: UUID) -> str:
         """Get the LangGraph thread ID for a session.
 
@@ -85,15 +217,12 @@ class AgentService:
             Events dict with type and payload:
             - {"type": "content", "content": "..."} - Streamed text
             - {"type": "tasks_extracting"} - Task extraction started
+            - {"type": "tasks_extracting", "titles": [...]} - Task titles streamed so far
             - {"type": "tasks_updated", "tasks": [...]} - Task list updated
             - {"type": "done"} - Chat complete
             - {"type": "error", "error": "..."} - Error occurred
         """
-        if not self._initialized:
-            await self.initialize()
-
-        # Compile graph with checkpointer
-        graph = get_planning_graph_builder().compile(checkpointer=self._checkpointer)
+        graph = await self._get_planning_graph()
 
         config: RunnableConfig = {
             "configurable": {
@@ -113,13 +242,20 @@ class AgentService:
         try:
             tasks_yielded = False
             extracting_started = False
+            extraction_buffer = ""
+            streamed_titles: list[str] = []
 
             # Stream events from the graph
             # New flow: should_extract -> [conditional] -> chat_with_tasks OR chat_only
+            # Only the should_extract node's own start/end and chat model events
+            # are used; filtering here keeps every other chain event from
+            # being built and queued
             async for event in graph.astream_events(
                 input_state,
                 config=config,
                 version="v2",
+                include_names=["should_extract"],
+                include_types=["chat_model"],
             ):
                 event_type = event.get("event")
                 # Get the node name from metadata
@@ -131,6 +267,25 @@ class AgentService:
                         yield {"type": "tasks_extracting"}
                         extracting_started = True
 
+                # Surface task titles as the extraction JSON streams in
+                elif (
+                    event_type == "on_chat_model_stream"
+                    and node_name == "should_extract"
+                ):
+                    chunk = event.get("data", {}).get("chunk")
+                    if chunk is None:
+                        continue
+                    delta = _extraction_delta(chunk)
+                    extraction_buffer += delta
+                    # A title can only complete when a key or object boundary
+                    # arrives, so skip re-parsing the buffer for other tokens
+                    if '"' not in delta and "}" not in delta:
+                        continue
+                    titles = _completed_task_titles(extraction_buffer)
+                    if len(titles) > len(streamed_titles):
+                        streamed_titles = titles
+                        yield {"type": "tasks_extracting", "titles": titles}
+
                 # When should_extract completes, emit tasks if any
                 elif event_type == "on_chain_end" and node_name == "should_extract":
                     output: dict[str, Any] = event.get("data", {}).get("output", {})
@@ -163,10 +318,7 @@ class AgentService:
         Returns:
             List of task dicts from the agent state
         """
-        if not self._initialized:
-            await self.initialize()
-
-        graph = get_planning_graph_builder().compile(checkpointer=self._checkpointer)
+        graph = await self._get_planning_graph()
         config: RunnableConfig = {
             "configurable": {"thread_id": self._get_thread_id(session_id)}
         }
@@ -185,10 +337,7 @@ class AgentService:
         Returns:
             List of message dicts with role and content
         """
-        if not self._initialized:
-            await self.initialize()
-
-        graph = get_planning_graph_builder().compile(checkpointer=self._checkpointer)
+        graph = await self._get_planning_graph()
         config: RunnableConfig = {
             "configurable": {"thread_id": self._get_thread_id(session_id)}
         }
@@ -270,13 +419,16 @@ class AgentService:
         """
         if not self._initialized:
             await self.initialize()
-
-        settings = get_settings()
+        llm = self._summary_llm
+        if llm is None:
+            raise RuntimeError("Agent service is not initialized")
 
         # Build the results summary for the LLM
         results_text = "\n".join(
-            f"- {r.get('title', 'Task')}: {r.get('result', 'Completed')}"
-            for r in task_results
+            [
+                f"- {r.get('title', 'Task')}: {r.get('result', 'Completed')}"
+                for r in task_results
+            ]
         )
 
         summary_context = f"""Execution completed:
@@ -286,36 +438,9 @@ class AgentService:
 Results:
 {results_text}"""
 
-        # System prompt for execution summary
-        system_prompt = """You are summarizing the results of task execution for the user.
-
-Based on the execution results provided, give a brief, friendly summary of what was accomplished.
-
-Guidelines:
-- Be conversational and positive
-- Use bullet points for key findings and results
-- Use **bold** for important highlights
-- Mention any issues if tasks failed
-- Keep it concise (3-6 bullet points max)
-- If there are notable artifacts created, mention them
-
-Format example:
-- **Main finding**: Brief description
-- **Key result**: What was discovered/accomplished
-- Any issues or next steps
-
-Remember: The user just watched their tasks execute. Give them a scannable, helpful summary."""
-
-        # Create standalone LLM with streaming
-        llm = ChatOpenAI(
-            model="gpt-4o",
-            api_key=SecretStr(settings.openai_api_key),
-            streaming=True,
-        )
-
         # Build messages for standalone call
         messages = [
-            SystemMessage(content=system_prompt),
+            _SUMMARY_SYSTEM_MESSAGE,
             HumanMessage(content=summary_context),
         ]
 
@@ -331,9 +456,7 @@ Remember: The user just watched their tasks execute. Give them a scannable, help
 
             # Save ONLY the AI message to checkpoint (no fake user message)
             if full_response:
-                graph = get_planning_graph_builder().compile(
-                    checkpointer=self._checkpointer
-                )
+                graph = await self._get_planning_graph()
                 update_config: RunnableConfig = {
                     "configurable": {"thread_id": self._get_thread_id(session_id)}
                 }
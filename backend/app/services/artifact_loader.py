@@ -0,0 +1,88 @@
+"""Batching loader for artifact lookups during a task execution."""
+
+import asyncio
+from contextvars import ContextVar
+from uuid import UUID
+
+from app.models.artifact import Artifact
+from app.services.artifact_service import artifact_service
+
+
+class ArtifactLoader:
+    """Coalesce artifact lookups into batched queries.
+
+    Loads requested in the same event-loop tick (e.g. several read_artifact
+    tool calls dispatched together) are fetched with a single query, and
+    results are cached for the lifetime of the loader. Callers share one
+    future per ID, so cancelling one caller does not cancel the others.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[UUID, asyncio.Future[Artifact | None]] = {}
+        self._pending: list[UUID] = []
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def load(self, artifact_id: UUID) -> Artifact | None:
+        """Load an artifact by ID, batching with other loads in this tick."""
+        future = self._cache.get(artifact_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[artifact_id] = future
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending.append(artifact_id)
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Start fetching all keys queued since the last dispatch."""
+        keys, self._pending = self._pending, []
+        batch = asyncio.create_task(self._load_batch(keys))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _load_batch(self, keys: list[UUID]) -> None:
+        """Fetch a batch of artifacts and resolve their futures."""
+        futures = [self._cache[key] for key in keys]
+        try:
+            artifacts = await artifact_service.get_many(keys)
+        except Exception as e:
+            # Drop failed keys from the cache so a later load can retry
+            for key, future in zip(keys, futures, strict=True):
+                self._cache.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in zip(keys, futures, strict=True):
+            if future.done():
+                # Cancelled futures must not be served from the cache
+                if future.cancelled():
+                    self._cache.pop(key, None)
+                continue
+            future.set_result(artifacts.get(key))
+
+
+_current_loader: ContextVar[ArtifactLoader | None] = ContextVar(
+    "artifact_loader", default=None
+)
+
+
+def use_artifact_loader() -> ArtifactLoader:
+    """Install a fresh artifact loader for the current context.
+
+    Tasks started afterwards (such as parallel tool calls) inherit it. Call
+    this in a context created for the loader's scope (for example with
+    contextvars.copy_context()) so the loader is dropped with that context.
+    """
+    loader = ArtifactLoader()
+    _current_loader.set(loader)
+    return loader
+
+
+def current_loader() -> ArtifactLoader:
+    """Get the artifact loader for the current context.
+
+    Falls back to a new, unshared loader when none has been installed.
+    """
+    return _current_loader.get() or ArtifactLoader()
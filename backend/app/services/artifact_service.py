@@ -1,5 +1,6 @@
 """Artifact service for CRUD operations."""
 
+import asyncio
 from typing import Any, cast
 from uuid import UUID
 
@@ -9,7 +10,12 @@ from app.models.base import ArtifactType
 
 
 class ArtifactService:
-    """Service for artifact CRUD operations."""
+    """Service for artifact CRUD operations.
+
+    Artifacts are created from execution streams and their content can be
+    large, so queries run in a worker thread (the Supabase client is
+    synchronous) instead of blocking the event loop.
+    """
 
     def __init__(self) -> None:
         self.client = get_supabase_client()
@@ -24,31 +30,42 @@ class ArtifactService:
             "type": artifact.type.value,
             "content": artifact.content,
         }
-        result = self.client.table(self.table).insert(data).execute()
+        query = self.client.table(self.table).insert(data)
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         return Artifact(**rows[0])
 
     async def get(self, artifact_id: UUID) -> Artifact | None:
         """Get an artifact by ID with full content."""
-        result = (
-            self.client.table(self.table)
-            .select("*")
-            .eq("id", str(artifact_id))
-            .execute()
-        )
+        query = self.client.table(self.table).select("*").eq("id", str(artifact_id))
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         if not rows:
             return None
         return Artifact(**rows[0])
 
+    async def get_many(self, artifact_ids: list[UUID]) -> dict[UUID, Artifact]:
+        """Get several artifacts by ID in one query, keyed by ID."""
+        if not artifact_ids:
+            return {}
+        query = (
+            self.client.table(self.table)
+            .select("*")
+            .in_("id", [str(artifact_id) for artifact_id in artifact_ids])
+        )
+        result = await asyncio.to_thread(query.execute)
+        rows = cast(list[dict[str, Any]], result.data)
+        artifacts = [Artifact(**row) for row in rows]
+        return {artifact.id: artifact for artifact in artifacts}
+
     async def get_summary(self, artifact_id: UUID) -> ArtifactSummary | None:
         """Get an artifact summary by ID (without content)."""
-        result = (
+        query = (
             self.client.table(self.table)
             .select("id, session_id, task_id, name, type, created_at")
             .eq("id", str(artifact_id))
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         if not rows:
             return None
@@ -69,30 +86,29 @@ class ArtifactService:
         if artifact_type:
             query = query.eq("type", artifact_type.value)
 
-        result = query.order("created_at").execute()
+        query = query.order("created_at")
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         return [ArtifactSummary(**row) for row in rows]
 
     async def list_by_task(self, task_id: UUID) -> list[ArtifactSummary]:
         """List all artifacts for a task (summaries only)."""
-        result = (
+        query = (
             self.client.table(self.table)
             .select("id, session_id, task_id, name, type, created_at")
             .eq("task_id", str(task_id))
             .order("created_at")
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         return [ArtifactSummary(**row) for row in rows]
 
     async def get_content(self, artifact_id: UUID) -> str | None:
         """Get just the content of an artifact (for download)."""
-        result = (
-            self.client.table(self.table)
-            .select("content")
-            .eq("id", str(artifact_id))
-            .execute()
+        query = (
+            self.client.table(self.table).select("content").eq("id", str(artifact_id))
         )
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         if not rows:
             return None
@@ -100,20 +116,15 @@ class ArtifactService:
 
     async def delete(self, artifact_id: UUID) -> bool:
         """Delete an artifact."""
-        result = (
-            self.client.table(self.table).delete().eq("id", str(artifact_id)).execute()
-        )
+        query = self.client.table(self.table).delete().eq("id", str(artifact_id))
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         return len(rows) > 0
 
     async def delete_by_session(self, session_id: UUID) -> int:
         """Delete all artifacts for a session."""
-        result = (
-            self.client.table(self.table)
-            .delete()
-            .eq("session_id", str(session_id))
-            .execute()
-        )
+        query = self.client.table(self.table).delete().eq("session_id", str(session_id))
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         return len(rows)
 
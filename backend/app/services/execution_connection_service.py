@@ -9,13 +9,18 @@ The mechanism works as follows:
 3. Backend checks if connection_id is still valid AND heartbeat is recent
 4. If heartbeat times out, connection_id changes, or pause is requested, execution pauses
 
+Queries run in a worker thread (the Supabase client is synchronous) because
+they are made from inside execution SSE streams and the heartbeat endpoint.
+
 Pause reasons:
 - "user_requested": User manually clicked pause button
 - "client_disconnected": Heartbeat timeout or connection superseded
+- "error": Execution failed unexpectedly (set by the execute stream)
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, cast
 from uuid import UUID, uuid4
 
 from app.core.database import get_supabase_client
@@ -40,7 +45,7 @@ class ExecutionConnectionService:
         connection_id = uuid4()
         now = datetime.now(UTC).isoformat()
 
-        self.client.table(self.table).upsert(
+        query = self.client.table(self.table).upsert(
             {
                 "session_id": str(session_id),
                 "connection_id": str(connection_id),
@@ -49,7 +54,8 @@ class ExecutionConnectionService:
                 "pause_requested": False,
             },
             on_conflict="session_id",
-        ).execute()
+        )
+        await asyncio.to_thread(query.execute)
 
         return connection_id
 
@@ -64,13 +70,13 @@ class ExecutionConnectionService:
         """
         now = datetime.now(UTC).isoformat()
 
-        result = (
+        query = (
             self.client.table(self.table)
             .update({"last_heartbeat": now})
             .eq("session_id", str(session_id))
             .eq("connection_id", str(connection_id))
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
 
         # If no rows updated, connection_id doesn't match (superseded)
         return len(result.data) > 0
@@ -92,12 +98,12 @@ class ExecutionConnectionService:
         Returns:
             True if connection is still active, False otherwise.
         """
-        result = (
+        query = (
             self.client.table(self.table)
             .select("connection_id, last_heartbeat")
             .eq("session_id", str(session_id))
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
 
         if not result.data:
             # No connection record - connection is not active
@@ -141,12 +147,12 @@ class ExecutionConnectionService:
             - "user_requested" if pause_requested is True
             - "client_disconnected" if heartbeat timeout or connection_id mismatch
         """
-        result = (
+        query = (
             self.client.table(self.table)
             .select("connection_id, last_heartbeat, pause_requested")
             .eq("session_id", str(session_id))
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
 
         if not result.data:
             # No connection record - connection is not active
@@ -176,36 +182,39 @@ class ExecutionConnectionService:
 
         return (True, None)
 
-    async def request_pause(self, session_id: UUID) -> bool:
+    async def request_pause(self, session_id: UUID) -> tuple[bool, str] | None:
         """Request pause for an active execution.
 
-        Sets the pause_requested flag to True. The execution loop will
-        detect this on its next checkpoint and pause gracefully.
+        Sets the pause_requested flag to True if the session is executing and
+        has a connection, in a single round-trip (see the
+        request_execution_pause function). The execution loop will detect
+        this on its next checkpoint and pause gracefully.
 
         Args:
             session_id: The session to pause
 
         Returns:
-            True if pause was requested (connection exists),
-            False if no active connection found.
+            Tuple of (paused, status) where paused is True if pause was
+            requested, and status is the current session status.
+            None if the session does not exist.
         """
-        result = (
-            self.client.table(self.table)
-            .update({"pause_requested": True})
-            .eq("session_id", str(session_id))
-            .execute()
+        query = self.client.rpc(
+            "request_execution_pause", {"p_session_id": str(session_id)}
         )
+        result = await asyncio.to_thread(query.execute)
 
-        return len(result.data) > 0
+        data = cast(dict[str, Any] | None, result.data)
+        if not data:
+            return None
+        return (bool(data["paused"]), str(data["status"]))
 
     async def clear_connection(self, session_id: UUID) -> None:
         """Clear the connection record when execution completes normally.
 
         This prevents stale records from accumulating in the database.
         """
-        self.client.table(self.table).delete().eq(
-            "session_id", str(session_id)
-        ).execute()
+        query = self.client.table(self.table).delete().eq("session_id", str(session_id))
+        await asyncio.to_thread(query.execute)
 
 
 # Singleton instance
@@ -0,0 +1,92 @@
+"""Background persistence of execution log events."""
+
+import asyncio
+import logging
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from app.services.execution_log_service import execution_log_service
+
+logger = logging.getLogger("uvicorn.error")
+
+# Most events written in one insert; events that arrive while a write is in
+# flight are picked up together by the next one
+LOG_BATCH_SIZE = 32
+
+# Events waiting to be written before new ones are dropped
+LOG_QUEUE_SIZE = 1024
+
+# Longest close() waits for queued events to be written
+LOG_CLOSE_TIMEOUT_SECONDS = 10.0
+
+_STOP = object()
+
+
+class ExecutionLogBuffer:
+    """Write execution log events from a background task.
+
+    add() only enqueues, so the SSE stream never waits on the database.
+    A single writer task drains the queue in batches, keeping writes in
+    emission order. Call close() when the stream ends.
+    """
+
+    def __init__(self, session_id: UUID) -> None:
+        self.session_id = session_id
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._writer: asyncio.Task[None] | None = None
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Queue an event for writing."""
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run())
+        try:
+            self._queue.put_nowait((datetime.now(UTC), event))
+        except asyncio.QueueFull:
+            logger.warning(
+                f"[EXECUTE] Execution log queue full, dropping {event.get('type')} "
+                f"event for session {self.session_id}"
+            )
+
+    async def close(self, timeout: float = LOG_CLOSE_TIMEOUT_SECONDS) -> None:
+        """Write out all queued events and stop the writer."""
+        if self._writer is None:
+            return
+        try:
+            await asyncio.wait_for(self._stop_writer(self._writer), timeout=timeout)
+        except TimeoutError:
+            logger.error(
+                f"[EXECUTE] Timed out writing execution logs for session "
+                f"{self.session_id}, {self._queue.qsize()} events not saved"
+            )
+
+    async def _stop_writer(self, writer: asyncio.Task[None]) -> None:
+        """Signal the writer to finish and wait for it."""
+        await self._queue.put(_STOP)
+        await writer
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until the stop signal."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < LOG_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # The stop signal is always the last item queued
+            stopping = batch[-1] is _STOP
+            if stopping:
+                batch.pop()
+            if batch:
+                await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, events: list[tuple[datetime, dict[str, Any]]]) -> None:
+        """Persist a batch, logging rather than raising on failure."""
+        try:
+            await execution_log_service.create_many_from_events(self.session_id, events)
+        except Exception as e:
+            logger.error(
+                f"[EXECUTE] Failed to persist {len(events)} execution log events "
+                f"for session {self.session_id}: {e}"
+            )
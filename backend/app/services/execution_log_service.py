@@ -1,8 +1,13 @@
 """Execution log service for CRUD operations."""
 
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
 
+from postgrest.types import ReturnMethod
+
 from app.core.database import get_supabase_client
 from app.models.execution_log import (
     ExecutionLog,
@@ -10,6 +15,12 @@ from app.models.execution_log import (
     ExecutionLogEventType,
 )
 
+# ExecutionLog columns under their camelCase API keys (PostgREST alias:column)
+_API_COLUMNS = (
+    "id, sessionId:session_id, taskId:task_id, eventType:event_type, "
+    "eventData:event_data, createdAt:created_at"
+)
+
 
 class ExecutionLogService:
     """Service for execution log CRUD operations."""
@@ -50,6 +61,40 @@ class ExecutionLogService:
         )
         return await self.create(log)
 
+    async def create_many_from_events(
+        self,
+        session_id: UUID,
+        events: Sequence[tuple[datetime, dict[str, Any]]],
+    ) -> None:
+        """Create execution logs for a batch of SSE events in one insert.
+
+        Each event is paired with the time it was emitted, which is stored as
+        created_at so logs keep their emission order within a batch.
+        """
+        if not events:
+            return
+
+        data = []
+        for created_at, event in events:
+            # Validate the event type before sending the batch
+            event_type = ExecutionLogEventType(event.get("type"))
+            task_id_str = event.get("taskId")
+            data.append(
+                {
+                    "session_id": str(session_id),
+                    "task_id": str(UUID(task_id_str)) if task_id_str else None,
+                    "event_type": event_type.value,
+                    "event_data": event,
+                    "created_at": created_at.isoformat(),
+                }
+            )
+        query = self.client.table(self.table).insert(
+            data, returning=ReturnMethod.minimal
+        )
+        # The Supabase client is synchronous; run the insert off the event loop
+        # so the streams being logged keep flowing while it is in flight
+        await asyncio.to_thread(query.execute)
+
     async def list_by_session(
         self,
         session_id: UUID,
@@ -68,6 +113,28 @@ class ExecutionLogService:
         rows = cast(list[dict[str, Any]], result.data)
         return [ExecutionLog(**row) for row in rows]
 
+    async def list_api_rows_by_session(
+        self,
+        session_id: UUID,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List execution logs for a session as API-shaped rows.
+
+        Columns are renamed to the camelCase keys ExecutionLog serializes to
+        by PostgREST itself, so the rows can be returned without building
+        and dumping a model per log.
+        """
+        query = (
+            self.client.table(self.table)
+            .select(_API_COLUMNS)
+            .eq("session_id", str(session_id))
+            .order("created_at")
+            .range(offset, offset + limit - 1)
+        )
+        result = await asyncio.to_thread(query.execute)
+        return cast(list[dict[str, Any]], result.data)
+
     async def list_by_task(self, task_id: UUID) -> list[ExecutionLog]:
         """List all execution logs for a specific task."""
         result = (
@@ -82,12 +149,13 @@ class ExecutionLogService:
 
     async def count_by_session(self, session_id: UUID) -> int:
         """Count total execution logs for a session."""
-        result = (
+        query = (
             self.client.table(self.table)
-            .select("id", count="exact")  # type: ignore[arg-type]
+            # HEAD request: only the count comes back, not the rows
+            .select("id", count="exact", head=True)  # type: ignore[arg-type]
             .eq("session_id", str(session_id))
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
         return result.count or 0
 
     async def delete_by_session(self, session_id: UUID) -> int:
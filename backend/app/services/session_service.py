@@ -1,5 +1,7 @@
 """Session service for CRUD operations."""
 
+import asyncio
+from collections.abc import Sequence
 from typing import Any, cast
 from uuid import UUID
 
@@ -13,7 +15,12 @@ from app.services.agent_service import agent_service
 
 
 class SessionService:
-    """Service for session CRUD operations."""
+    """Service for session CRUD operations.
+
+    Queries run in a worker thread (the Supabase client is synchronous) so
+    they never block the event loop, which chat and execution streams share
+    with every other request.
+    """
 
     def __init__(self) -> None:
         self.client = get_supabase_client()
@@ -25,18 +32,15 @@ class SessionService:
             "title": title,
             "status": SessionStatus.PLANNING.value,
         }
-        result = self.client.table(self.table).insert(data).execute()
+        query = self.client.table(self.table).insert(data)
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         return Session(**rows[0])
 
     async def get(self, session_id: UUID) -> Session | None:
         """Get a session by ID."""
-        result = (
-            self.client.table(self.table)
-            .select("*")
-            .eq("id", str(session_id))
-            .execute()
-        )
+        query = self.client.table(self.table).select("*").eq("id", str(session_id))
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         if not rows:
             return None
@@ -49,19 +53,21 @@ class SessionService:
             return None
 
         # Fetch related data from database
-        tasks_result = (
+        tasks_query = (
             self.client.table("tasks")
             .select("*")
             .eq("session_id", str(session_id))
             .order("order")
-            .execute()
         )
-        artifacts_result = (
+        artifacts_query = (
             self.client.table("artifacts")
             .select("id, session_id, task_id, name, type, created_at")
             .eq("session_id", str(session_id))
             .order("created_at")
-            .execute()
+        )
+        tasks_result, artifacts_result = await asyncio.gather(
+            asyncio.to_thread(tasks_query.execute),
+            asyncio.to_thread(artifacts_query.execute),
         )
 
         # Fetch messages from LangGraph checkpoint state
@@ -93,7 +99,7 @@ class SessionService:
             query = query.eq("status", status.value)
 
         query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
-        result = query.execute()
+        result = await asyncio.to_thread(query.execute)
 
         rows = cast(list[dict[str, Any]], result.data)
         sessions = [Session(**s) for s in rows]
@@ -104,12 +110,12 @@ class SessionService:
         self, session_id: UUID, status: SessionStatus
     ) -> Session | None:
         """Update session status."""
-        result = (
+        query = (
             self.client.table(self.table)
             .update({"status": status.value})
             .eq("id", str(session_id))
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         if not rows:
             return None
@@ -117,22 +123,85 @@ class SessionService:
 
     async def update_title(self, session_id: UUID, title: str) -> Session | None:
         """Update session title."""
-        result = (
+        query = (
             self.client.table(self.table)
             .update({"title": title[:200]})
             .eq("id", str(session_id))
-            .execute()
         )
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         if not rows:
             return None
         return Session(**rows[0])
 
+    async def begin_chat(self, session_id: UUID, message: str) -> Session | None:
+        """Prepare a session for a chat message in one round-trip.
+
+        Titles the session from the message if it still has the default
+        title (see the begin_chat function). Returns None if the session
+        does not exist or is completed.
+        """
+        query = self.client.rpc(
+            "begin_chat",
+            {"p_session_id": str(session_id), "p_title": message[:200]},
+        )
+        result = await asyncio.to_thread(query.execute)
+        rows = cast(list[dict[str, Any]], result.data)
+        if not rows:
+            return None
+        return Session(**rows[0])
+
+    async def claim_execution(
+        self, session_id: UUID
+    ) -> tuple[Session, UUID | None] | None:
+        """Pause an executing session for a new connection in one round-trip.
+
+        If the session is executing, it is paused and a new execution
+        connection is registered, superseding the old one (see the
+        claim_execution function).
+
+        Returns:
+            Tuple of (session, connection_id) where connection_id is None if
+            the session was not executing. None if the session does not exist.
+        """
+        query = self.client.rpc("claim_execution", {"p_session_id": str(session_id)})
+        result = await asyncio.to_thread(query.execute)
+        data = cast(dict[str, Any] | None, result.data)
+        if not data:
+            return None
+        session = Session(**data["session"])
+        connection_id = data.get("connection_id")
+        return session, UUID(connection_id) if connection_id else None
+
+    async def begin_execution(
+        self, session_id: UUID
+    ) -> tuple[Session, Sequence[Task], UUID | None] | None:
+        """Start executing a session in one round-trip.
+
+        If the session is planning or paused and has tasks to run, it is set
+        to executing and a new execution connection is registered (see the
+        begin_execution function). Paused sessions also return their
+        in_progress tasks so they resume from their checkpoint.
+
+        Returns:
+            Tuple of (session, tasks, connection_id) where connection_id is
+            None, with no tasks, if execution did not start. None if the
+            session does not exist.
+        """
+        query = self.client.rpc("begin_execution", {"p_session_id": str(session_id)})
+        result = await asyncio.to_thread(query.execute)
+        data = cast(dict[str, Any] | None, result.data)
+        if not data:
+            return None
+        session = Session(**data["session"])
+        tasks = [Task(**row) for row in data["tasks"]]
+        connection_id = data.get("connection_id")
+        return session, tasks, UUID(connection_id) if connection_id else None
+
     async def delete(self, session_id: UUID) -> bool:
         """Delete a session (cascades to related data)."""
-        result = (
-            self.client.table(self.table).delete().eq("id", str(session_id)).execute()
-        )
+        query = self.client.table(self.table).delete().eq("id", str(session_id))
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         return len(rows) > 0
 
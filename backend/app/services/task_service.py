@@ -1,15 +1,22 @@
 """Task service for CRUD operations."""
 
+import asyncio
 from typing import Any, cast
 from uuid import UUID
 
 from app.core.database import get_supabase_client
 from app.models.base import TaskStatus
-from app.models.task import Task, TaskCreate, TaskUpdate
+from app.models.task import Task, TaskCreate, TaskResultsSummary, TaskUpdate
 
 
 class TaskService:
-    """Service for task CRUD operations."""
+    """Service for task CRUD operations.
+
+    get() and the status transitions are called from execution SSE streams,
+    so their queries run in a worker thread (the Supabase client is
+    synchronous) instead of blocking the event loop. Transitions are
+    conditional updates, so the common case is a single round-trip.
+    """
 
     def __init__(self) -> None:
         self.client = get_supabase_client()
@@ -44,11 +51,33 @@ class TaskService:
         rows = cast(list[dict[str, Any]], result.data)
         return [Task(**row) for row in rows]
 
+    async def replace_by_session(
+        self, session_id: UUID, tasks: list[TaskCreate]
+    ) -> list[Task]:
+        """Replace all tasks for a session atomically.
+
+        Deletes the existing tasks and inserts the new ones in a single
+        database transaction (see the replace_session_tasks function).
+        """
+        data = [
+            {
+                "title": t.title,
+                "description": t.description,
+                "order": t.order,
+            }
+            for t in tasks
+        ]
+        result = self.client.rpc(
+            "replace_session_tasks",
+            {"p_session_id": str(session_id), "p_tasks": data},
+        ).execute()
+        rows = cast(list[dict[str, Any]], result.data)
+        return sorted((Task(**row) for row in rows), key=lambda t: t.order)
+
     async def get(self, task_id: UUID) -> Task | None:
         """Get a task by ID."""
-        result = (
-            self.client.table(self.table).select("*").eq("id", str(task_id)).execute()
-        )
+        query = self.client.table(self.table).select("*").eq("id", str(task_id))
+        result = await asyncio.to_thread(query.execute)
         rows = cast(list[dict[str, Any]], result.data)
         if not rows:
             return None
@@ -66,6 +95,39 @@ class TaskService:
         rows = cast(list[dict[str, Any]], result.data)
         return [Task(**row) for row in rows]
 
+    async def get_results_summary(self, session_id: UUID) -> TaskResultsSummary:
+        """Get completed task results and status counts for a session.
+
+        Fetches only the columns an execution summary needs and tallies
+        them in a single pass.
+        """
+        result = (
+            self.client.table(self.table)
+            .select("title, result, status")
+            .eq("session_id", str(session_id))
+            .order("order")
+            .execute()
+        )
+        rows = cast(list[dict[str, Any]], result.data)
+
+        task_results: list[dict[str, str]] = []
+        failed = 0
+        for row in rows:
+            status = row["status"]
+            if status == TaskStatus.DONE.value:
+                task_results.append(
+                    {"title": row["title"], "result": row["result"] or "Completed"}
+                )
+            elif status == TaskStatus.FAILED.value:
+                failed += 1
+
+        return TaskResultsSummary(
+            task_results=task_results,
+            total=len(rows),
+            completed=len(task_results),
+            failed=failed,
+        )
+
     async def update(self, task_id: UUID, update: TaskUpdate) -> Task | None:
         """Update a task."""
         data: dict[str, str | int | None] = {}
@@ -165,6 +227,33 @@ class TaskService:
         rows = cast(list[dict[str, Any]], result.data)
         return [Task(**row) for row in rows]
 
+    async def _transition(
+        self, task_id: UUID, from_status: TaskStatus, data: dict[str, str]
+    ) -> Task | None:
+        """Update a task only if it is in from_status, in a single query.
+
+        Returns the updated task, or None if the task is missing or in
+        another status.
+        """
+        query = (
+            self.client.table(self.table)
+            .update(data)
+            .eq("id", str(task_id))
+            .eq("status", from_status.value)
+        )
+        result = await asyncio.to_thread(query.execute)
+        rows = cast(list[dict[str, Any]], result.data)
+        if not rows:
+            return None
+        return Task(**rows[0])
+
+    async def _get_for_transition(self, task_id: UUID) -> Task:
+        """Get a task whose conditional transition matched no row."""
+        task = await self.get(task_id)
+        if not task:
+            raise ValueError(f"Task {task_id} not found")
+        return task
+
     async def start_task(self, task_id: UUID) -> Task:
         """Start a task - changes status from pending to in_progress.
 
@@ -179,29 +268,23 @@ class TaskService:
         Raises:
             ValueError: If task not found or invalid status transition
         """
-        task = await self.get(task_id)
-        if not task:
-            raise ValueError(f"Task {task_id} not found")
+        started = await self._transition(
+            task_id, TaskStatus.PENDING, {"status": TaskStatus.IN_PROGRESS.value}
+        )
+        if started:
+            return started
+
+        task = await self._get_for_transition(task_id)
 
-        # Allow starting from pending, or resuming from in_progress (paused session)
+        # Allow resuming from in_progress (paused session)
         if task.status == TaskStatus.IN_PROGRESS:
             # Task is already in progress (resuming from pause), return as-is
             return task
 
-        if task.status != TaskStatus.PENDING:
-            raise ValueError(
-                f"Cannot start task: current status is {task.status.value}, "
-                "expected 'pending' or 'in_progress'"
-            )
-
-        result = (
-            self.client.table(self.table)
-            .update({"status": TaskStatus.IN_PROGRESS.value})
-            .eq("id", str(task_id))
-            .execute()
+        raise ValueError(
+            f"Cannot start task: current status is {task.status.value}, "
+            "expected 'pending' or 'in_progress'"
         )
-        rows = cast(list[dict[str, Any]], result.data)
-        return Task(**rows[0])
 
     async def complete_task(
         self,
@@ -220,26 +303,19 @@ class TaskService:
         Raises:
             ValueError: If task not found or invalid status transition
         """
-        task = await self.get(task_id)
-        if not task:
-            raise ValueError(f"Task {task_id} not found")
-
-        if task.status != TaskStatus.IN_PROGRESS:
-            raise ValueError(
-                f"Cannot complete task: current status is {task.status.value}, "
-                "expected 'in_progress'"
-            )
-
         data: dict[str, str] = {
             "status": TaskStatus.DONE.value,
             "result": result_text,
         }
-
-        result = (
-            self.client.table(self.table).update(data).eq("id", str(task_id)).execute()
+        completed = await self._transition(task_id, TaskStatus.IN_PROGRESS, data)
+        if completed:
+            return completed
+
+        task = await self._get_for_transition(task_id)
+        raise ValueError(
+            f"Cannot complete task: current status is {task.status.value}, "
+            "expected 'in_progress'"
         )
-        rows = cast(list[dict[str, Any]], result.data)
-        return Task(**rows[0])
 
     async def fail_task(
         self,
@@ -258,29 +334,19 @@ class TaskService:
         Raises:
             ValueError: If task not found or invalid status transition
         """
-        task = await self.get(task_id)
-        if not task:
-            raise ValueError(f"Task {task_id} not found")
-
-        if task.status != TaskStatus.IN_PROGRESS:
-            raise ValueError(
-                f"Cannot fail task: current status is {task.status.value}, "
-                "expected 'in_progress'"
-            )
-
-        result = (
-            self.client.table(self.table)
-            .update(
-                {
-                    "status": TaskStatus.FAILED.value,
-                    "result": error,
-                }
-            )
-            .eq("id", str(task_id))
-            .execute()
+        data: dict[str, str] = {
+            "status": TaskStatus.FAILED.value,
+            "result": error,
+        }
+        failed = await self._transition(task_id, TaskStatus.IN_PROGRESS, data)
+        if failed:
+            return failed
+
+        task = await self._get_for_transition(task_id)
+        raise ValueError(
+            f"Cannot fail task: current status is {task.status.value}, "
+            "expected 'in_progress'"
         )
-        rows = cast(list[dict[str, Any]], result.data)
-        return Task(**rows[0])
 
 
 # Singleton instance
@@ -28,8 +28,10 @@ def mock_supabase():
     mock.update.return_value = mock
     mock.delete.return_value = mock
     mock.eq.return_value = mock
+    mock.in_.return_value = mock
     mock.order.return_value = mock
     mock.limit.return_value = mock
+    mock.rpc.return_value = mock
     # execute() returns APIResponse with .data attribute
     mock.execute.return_value = MagicMock(data=[])
     return mock
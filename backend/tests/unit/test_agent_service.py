@@ -0,0 +1,74 @@
+"""Tests for AgentService streaming helpers and initialization."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+
+class TestExtractionStreaming:
+    """Test partial task extraction parsing."""
+
+    def test_extraction_delta_reads_content(self):
+        """JSON carried as message content is returned as-is."""
+        from app.services.agent_service import _extraction_delta
+
+        chunk = AIMessageChunk(content='{"tasks": [')
+
+        assert _extraction_delta(chunk) == '{"tasks": ['
+
+    def test_extraction_delta_reads_tool_call_chunks(self):
+        """JSON carried as tool call arguments is concatenated."""
+        from app.services.agent_service import _extraction_delta
+
+        chunk = AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": "TaskList", "args": '{"tasks"', "id": "call_1", "index": 0}
+            ],
+        )
+
+        assert _extraction_delta(chunk) == '{"tasks"'
+
+    def test_completed_titles_skip_title_still_streaming(self):
+        """The last title is held back until its description starts."""
+        from app.services.agent_service import _completed_task_titles
+
+        buffer = '{"tasks": [{"title": "Research options", "description": "Fi'
+        assert _completed_task_titles(buffer) == ["Research options"]
+
+        buffer = '{"tasks": [{"title": "Research options", "description": null}, {"title": "Comp'
+        assert _completed_task_titles(buffer) == ["Research options"]
+
+    def test_completed_titles_handles_incomplete_json(self):
+        """Buffers without any parseable tasks yield no titles."""
+        from app.services.agent_service import _completed_task_titles
+
+        assert _completed_task_titles("") == []
+        assert _completed_task_titles("{") == []
+        assert _completed_task_titles('{"tasks": [{"title": "Res') == []
+
+
+class TestAgentServiceInitialize:
+    """Test initialization shared between startup warmup and requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_initialize_opens_once(self):
+        """Callers arriving mid-initialization wait instead of opening again."""
+        from app.services.agent_service import AgentService
+
+        service = AgentService()
+        opened = 0
+
+        async def fake_open():
+            nonlocal opened
+            opened += 1
+            await asyncio.sleep(0.01)
+            service._initialized = True
+
+        with patch.object(service, "_open", side_effect=fake_open):
+            await asyncio.gather(service.initialize(), service.initialize())
+
+        assert opened == 1
+        assert service._initialized
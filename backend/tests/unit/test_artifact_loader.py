@@ -0,0 +1,105 @@
+"""Tests for the batching artifact loader."""
+
+import asyncio
+from contextvars import copy_context
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from app.services.artifact_loader import (
+    ArtifactLoader,
+    current_loader,
+    use_artifact_loader,
+)
+
+ARTIFACT_A = UUID("123e4567-e89b-12d3-a456-426614174010")
+ARTIFACT_B = UUID("123e4567-e89b-12d3-a456-426614174011")
+
+
+class TestArtifactLoader:
+    """Test coalescing and caching of artifact lookups."""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_same_tick_share_one_query(self):
+        """Concurrent loads are fetched with a single get_many call."""
+        artifact_a = MagicMock(id=ARTIFACT_A)
+        get_many = AsyncMock(return_value={ARTIFACT_A: artifact_a})
+
+        with patch("app.services.artifact_loader.artifact_service.get_many", get_many):
+            loader = ArtifactLoader()
+            results = await asyncio.gather(
+                loader.load(ARTIFACT_A),
+                loader.load(ARTIFACT_B),
+                loader.load(ARTIFACT_A),
+            )
+
+        assert results == [artifact_a, None, artifact_a]
+        get_many.assert_awaited_once_with([ARTIFACT_A, ARTIFACT_B])
+
+    @pytest.mark.asyncio
+    async def test_repeated_load_uses_cache(self):
+        """A later load of the same ID does not query again."""
+        get_many = AsyncMock(return_value={})
+
+        with patch("app.services.artifact_loader.artifact_service.get_many", get_many):
+            loader = ArtifactLoader()
+            await loader.load(ARTIFACT_A)
+            await loader.load(ARTIFACT_A)
+
+        get_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_can_be_retried(self):
+        """Errors propagate to waiters and are not cached."""
+        get_many = AsyncMock(side_effect=[RuntimeError("db down"), {}])
+
+        with patch("app.services.artifact_loader.artifact_service.get_many", get_many):
+            loader = ArtifactLoader()
+            with pytest.raises(RuntimeError):
+                await loader.load(ARTIFACT_A)
+            assert await loader.load(ARTIFACT_A) is None
+
+        assert get_many.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_load_does_not_affect_other_callers(self):
+        """Cancelling one caller mid-batch leaves the batch and cache intact."""
+        artifact_a = MagicMock(id=ARTIFACT_A)
+        artifact_b = MagicMock(id=ARTIFACT_B)
+        release = asyncio.Event()
+
+        async def slow_get_many(keys):
+            await release.wait()
+            return {ARTIFACT_A: artifact_a, ARTIFACT_B: artifact_b}
+
+        get_many = AsyncMock(side_effect=slow_get_many)
+
+        with patch("app.services.artifact_loader.artifact_service.get_many", get_many):
+            loader = ArtifactLoader()
+            load_a = asyncio.create_task(loader.load(ARTIFACT_A))
+            load_b = asyncio.create_task(loader.load(ARTIFACT_B))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            load_a.cancel()
+            release.set()
+
+            assert await asyncio.wait_for(load_b, timeout=1) is artifact_b
+            with pytest.raises(asyncio.CancelledError):
+                await load_a
+            assert await loader.load(ARTIFACT_A) is artifact_a
+
+        get_many.assert_awaited_once()
+
+
+class TestUseArtifactLoader:
+    """Test installing a loader for the current context."""
+
+    def test_loader_stays_in_its_context(self):
+        """A loader installed in a copied context is not seen outside it."""
+        context = copy_context()
+        installed = context.run(use_artifact_loader)
+
+        assert context.run(current_loader) is installed
+        assert current_loader() is not installed
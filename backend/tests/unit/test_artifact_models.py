@@ -0,0 +1,21 @@
+"""Tests for artifact model validation."""
+
+from app.models.artifact import MAX_CONTENT_BYTES, content_exceeds_limit
+
+
+class TestContentSizeLimit:
+    """Test the 100KB artifact content limit."""
+
+    def test_ascii_content_at_limit_is_allowed(self):
+        """Content exactly at the limit is accepted."""
+        assert not content_exceeds_limit("a" * MAX_CONTENT_BYTES)
+
+    def test_ascii_content_over_limit_is_rejected(self):
+        """Content one byte over the limit is rejected."""
+        assert content_exceeds_limit("a" * (MAX_CONTENT_BYTES + 1))
+
+    def test_multibyte_content_is_measured_in_bytes(self):
+        """Multi-byte characters count by their encoded size."""
+        # Each "€" is 3 bytes in UTF-8
+        assert not content_exceeds_limit("€" * (MAX_CONTENT_BYTES // 3))
+        assert content_exceeds_limit("€" * (MAX_CONTENT_BYTES // 3 + 1))
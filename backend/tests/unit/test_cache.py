@@ -0,0 +1,42 @@
+"""Tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test expiry and eviction of cached values."""
+
+    def test_returns_cached_value(self):
+        """A stored value is returned until it expires."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("missing") is None
+
+    def test_expired_value_is_dropped(self):
+        """Values are not returned after their TTL."""
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", "long")
+            cache.set("b", "short", ttl=5)
+        with patch("app.core.cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") == "long"
+            assert cache.get("b") is None
+
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
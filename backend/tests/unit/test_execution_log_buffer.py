@@ -0,0 +1,83 @@
+"""Tests for background execution log persistence."""
+
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import pytest
+
+from app.services.execution_log_buffer import LOG_BATCH_SIZE, ExecutionLogBuffer
+
+SESSION_ID = UUID("123e4567-e89b-12d3-a456-426614174001")
+
+
+class TestExecutionLogBuffer:
+    """Test batching and closing of the execution log writer."""
+
+    @pytest.mark.asyncio
+    async def test_close_writes_queued_events_in_one_batch(self):
+        """Events queued before the writer runs are written together."""
+        create_many = AsyncMock()
+        events = [{"type": "tool_call", "n": i} for i in range(3)]
+
+        with patch(
+            "app.services.execution_log_buffer.execution_log_service.create_many_from_events",
+            create_many,
+        ):
+            buffer = ExecutionLogBuffer(SESSION_ID)
+            for event in events:
+                buffer.add(event)
+            create_many.assert_not_awaited()
+            await buffer.close()
+
+        create_many.assert_awaited_once()
+        session_id, batch = create_many.await_args.args
+        assert session_id == SESSION_ID
+        assert [event for _, event in batch] == events
+        timestamps = [created_at for created_at, _ in batch]
+        assert timestamps == sorted(timestamps)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_batch_size(self):
+        """A backlog larger than the batch size is split across inserts."""
+        create_many = AsyncMock()
+
+        with patch(
+            "app.services.execution_log_buffer.execution_log_service.create_many_from_events",
+            create_many,
+        ):
+            buffer = ExecutionLogBuffer(SESSION_ID)
+            for i in range(LOG_BATCH_SIZE + 1):
+                buffer.add({"type": "tool_result", "n": i})
+            await buffer.close()
+
+        assert create_many.await_count == 2
+        batch_sizes = [len(call.args[1]) for call in create_many.await_args_list]
+        assert batch_sizes == [LOG_BATCH_SIZE, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_raise(self):
+        """A failing batch write is logged and does not break the stream."""
+        create_many = AsyncMock(side_effect=RuntimeError("db down"))
+
+        with patch(
+            "app.services.execution_log_buffer.execution_log_service.create_many_from_events",
+            create_many,
+        ):
+            buffer = ExecutionLogBuffer(SESSION_ID)
+            buffer.add({"type": "done"})
+            await buffer.close()
+
+        create_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_without_events_does_nothing(self):
+        """Closing a buffer that never received events makes no writes."""
+        create_many = AsyncMock()
+
+        with patch(
+            "app.services.execution_log_buffer.execution_log_service.create_many_from_events",
+            create_many,
+        ):
+            await ExecutionLogBuffer(SESSION_ID).close()
+
+        create_many.assert_not_awaited()
@@ -97,6 +97,36 @@ class TestChatNode:
                 assert EXECUTION_SUMMARY_PROMPT in system_msg.content
 
 
+class TestExecutionSummaryDetection:
+    """Test detection of execution summary requests."""
+
+    def test_detects_marker_in_string_content(self):
+        """String content containing the marker is an execution summary."""
+        from app.agent.graph import _is_exec_summary
+
+        assert _is_exec_summary(HumanMessage(content="[EXECUTION COMPLETE] Done."))
+        assert not _is_exec_summary(HumanMessage(content="Plan a trip"))
+
+    def test_detects_marker_in_first_text_part(self):
+        """List content is checked through its first text part."""
+        from app.agent.graph import _is_exec_summary
+
+        message = HumanMessage(
+            content=[
+                {"type": "image_url", "image_url": {"url": "https://example.com"}},
+                {"type": "text", "text": "[EXECUTION COMPLETE] Done."},
+            ]
+        )
+
+        assert _is_exec_summary(message)
+
+    def test_missing_message_is_not_summary(self):
+        """No message means no execution summary."""
+        from app.agent.graph import _is_exec_summary
+
+        assert not _is_exec_summary(None)
+
+
 class TestTaskExtractionNode:
     """Test task extraction node behavior.
 
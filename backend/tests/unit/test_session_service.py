@@ -0,0 +1,181 @@
+"""Tests for SessionService chat and execution preparation."""
+
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from app.models.base import SessionStatus
+from app.services.session_service import SessionService
+
+
+class TestSessionServiceBeginChat:
+    """Test the single round-trip chat preparation."""
+
+    @pytest.fixture
+    def session_service(self, mock_supabase):
+        """Create SessionService with mocked Supabase client."""
+        with patch(
+            "app.services.session_service.get_supabase_client",
+            return_value=mock_supabase,
+        ):
+            service = SessionService()
+            yield service
+
+    @pytest.mark.asyncio
+    async def test_begin_chat_returns_session(
+        self, session_service, mock_supabase, mock_session
+    ):
+        """The RPC result is returned as a Session with a truncated title."""
+        session_id = UUID(mock_session["id"])
+        mock_supabase.execute.return_value = MagicMock(data=[mock_session])
+
+        result = await session_service.begin_chat(session_id, "x" * 300)
+
+        assert result.id == session_id
+        mock_supabase.rpc.assert_called_once_with(
+            "begin_chat",
+            {"p_session_id": mock_session["id"], "p_title": "x" * 200},
+        )
+
+    @pytest.mark.asyncio
+    async def test_begin_chat_rejected_returns_none(
+        self, session_service, mock_supabase, mock_session
+    ):
+        """Missing or completed sessions yield no rows and return None."""
+        mock_supabase.execute.return_value = MagicMock(data=[])
+
+        result = await session_service.begin_chat(UUID(mock_session["id"]), "Hi")
+
+        assert result is None
+
+
+class TestSessionServiceClaimExecution:
+    """Test claiming an executing session in one round-trip."""
+
+    @pytest.fixture
+    def session_service(self, mock_supabase):
+        """Create SessionService with mocked Supabase client."""
+        with patch(
+            "app.services.session_service.get_supabase_client",
+            return_value=mock_supabase,
+        ):
+            service = SessionService()
+            yield service
+
+    @pytest.mark.asyncio
+    async def test_claim_executing_session(
+        self, session_service, mock_supabase, mock_session
+    ):
+        """A claimed session comes back paused with a new connection ID."""
+        session_id = UUID(mock_session["id"])
+        connection_id = "123e4567-e89b-12d3-a456-426614174042"
+        mock_supabase.execute.return_value = MagicMock(
+            data={
+                "session": {**mock_session, "status": "paused"},
+                "connection_id": connection_id,
+            }
+        )
+
+        session, new_connection_id = await session_service.claim_execution(session_id)
+
+        assert session.status == SessionStatus.PAUSED
+        assert new_connection_id == UUID(connection_id)
+        mock_supabase.rpc.assert_called_once_with(
+            "claim_execution", {"p_session_id": mock_session["id"]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_claim_idle_session_returns_no_connection(
+        self, session_service, mock_supabase, mock_session
+    ):
+        """A session that is not executing is returned without a connection."""
+        mock_supabase.execute.return_value = MagicMock(
+            data={"session": mock_session, "connection_id": None}
+        )
+
+        session, connection_id = await session_service.claim_execution(
+            UUID(mock_session["id"])
+        )
+
+        assert session.status == SessionStatus.PLANNING
+        assert connection_id is None
+
+    @pytest.mark.asyncio
+    async def test_claim_missing_session_returns_none(
+        self, session_service, mock_supabase, mock_session
+    ):
+        """A missing session yields None."""
+        mock_supabase.execute.return_value = MagicMock(data=None)
+
+        assert await session_service.claim_execution(UUID(mock_session["id"])) is None
+
+
+class TestSessionServiceBeginExecution:
+    """Test the single round-trip execution start."""
+
+    @pytest.fixture
+    def session_service(self, mock_supabase):
+        """Create SessionService with mocked Supabase client."""
+        with patch(
+            "app.services.session_service.get_supabase_client",
+            return_value=mock_supabase,
+        ):
+            service = SessionService()
+            yield service
+
+    @pytest.mark.asyncio
+    async def test_begin_execution_returns_tasks_and_connection(
+        self, session_service, mock_supabase, mock_session, mock_task_pending
+    ):
+        """A started session comes back executing with its tasks."""
+        session_id = UUID(mock_session["id"])
+        connection_id = "123e4567-e89b-12d3-a456-426614174042"
+        mock_supabase.execute.return_value = MagicMock(
+            data={
+                "session": {**mock_session, "status": "executing"},
+                "tasks": [mock_task_pending],
+                "connection_id": connection_id,
+            }
+        )
+
+        session, tasks, new_connection_id = await session_service.begin_execution(
+            session_id
+        )
+
+        assert session.status == SessionStatus.EXECUTING
+        assert [t.id for t in tasks] == [UUID(mock_task_pending["id"])]
+        assert new_connection_id == UUID(connection_id)
+        mock_supabase.rpc.assert_called_once_with(
+            "begin_execution", {"p_session_id": mock_session["id"]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_begin_execution_not_started(
+        self, session_service, mock_supabase, mock_session
+    ):
+        """A session that cannot start is returned without tasks or connection."""
+        mock_supabase.execute.return_value = MagicMock(
+            data={
+                "session": {**mock_session, "status": "completed"},
+                "tasks": [],
+                "connection_id": None,
+            }
+        )
+
+        session, tasks, connection_id = await session_service.begin_execution(
+            UUID(mock_session["id"])
+        )
+
+        assert session.status == SessionStatus.COMPLETED
+        assert tasks == []
+        assert connection_id is None
+
+    @pytest.mark.asyncio
+    async def test_begin_execution_missing_session_returns_none(
+        self, session_service, mock_supabase, mock_session
+    ):
+        """A missing session yields None."""
+        mock_supabase.execute.return_value = MagicMock(data=None)
+
+        assert await session_service.begin_execution(UUID(mock_session["id"])) is None
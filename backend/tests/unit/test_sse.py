@@ -0,0 +1,210 @@
+"""Tests for the shared SSE helpers."""
+
+import asyncio
+from contextvars import ContextVar, copy_context
+
+import pytest
+
+from app.api.sse import (
+    KEEPALIVE_FRAME,
+    coalesce_content,
+    sse_event,
+    with_keepalive,
+)
+
+
+async def _collect(stream):
+    return [frame async for frame in stream]
+
+
+class TestSseEvent:
+    """Test SSE frame formatting."""
+
+    def test_formats_event_and_json_data(self):
+        """Frames carry the event name and a JSON data line."""
+        frame = sse_event("done", {"type": "done"})
+
+        assert frame == b'event: done\ndata: {"type":"done"}\n\n'
+
+    def test_falls_back_for_values_orjson_rejects(self):
+        """Payloads orjson cannot encode are still serialized."""
+        frame = sse_event("tool_call", {"input": {"n": 2**70}})
+
+        assert frame == b'event: tool_call\ndata: {"input":{"n":%d}}\n\n' % 2**70
+
+
+class TestCoalesceContent:
+    """Test merging of streamed content tokens."""
+
+    @pytest.mark.asyncio
+    async def test_merges_tokens_within_interval(self):
+        """The first token goes out alone, followers are merged in order."""
+
+        async def source():
+            for token in ["a", "b", "c"]:
+                yield {"type": "content", "taskId": "t1", "content": token}
+
+        events = await _collect(coalesce_content(source(), interval=10))
+
+        assert events == [
+            {"type": "content", "taskId": "t1", "content": "a"},
+            {"type": "content", "taskId": "t1", "content": "bc"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flushes_held_tokens_before_other_events(self):
+        """Held tokens are sent before the next non-content event."""
+
+        async def source():
+            yield {"type": "content", "content": "a"}
+            yield {"type": "content", "content": "b"}
+            yield {"type": "content", "content": "c"}
+            yield {"type": "done"}
+
+        events = await _collect(coalesce_content(source(), interval=10))
+
+        assert events == [
+            {"type": "content", "content": "a"},
+            {"type": "content", "content": "bc"},
+            {"type": "done"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sends_tokens_after_interval(self):
+        """Tokens further apart than the interval are sent individually."""
+
+        async def source():
+            yield {"type": "content", "content": "a"}
+            await asyncio.sleep(0.02)
+            yield {"type": "content", "content": "b"}
+
+        events = await _collect(coalesce_content(source(), interval=0.01))
+
+        assert [e["content"] for e in events] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_held_tokens_when_source_stalls(self):
+        """Held tokens are sent once the interval runs out, not on the next event."""
+        release = asyncio.Event()
+
+        async def source():
+            yield {"type": "content", "content": "a"}
+            yield {"type": "content", "content": "b"}
+            await release.wait()
+            yield {"type": "done"}
+
+        stream = coalesce_content(source(), interval=0.01)
+        first = await asyncio.wait_for(anext(stream), timeout=1)
+        held = await asyncio.wait_for(anext(stream), timeout=1)
+        release.set()
+        rest = await _collect(stream)
+
+        assert [first, held, *rest] == [
+            {"type": "content", "content": "a"},
+            {"type": "content", "content": "b"},
+            {"type": "done"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flushes_held_tokens_before_source_error(self):
+        """Held tokens are sent before an error from the source is raised."""
+
+        async def source():
+            yield {"type": "content", "content": "a"}
+            yield {"type": "content", "content": "b"}
+            raise RuntimeError("boom")
+
+        events = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for event in coalesce_content(source(), interval=10):
+                events.append(event)
+
+        assert [e["content"] for e in events] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_runs_source_in_given_context(self):
+        """The source sees context variables set only in the given context."""
+        var: ContextVar[str] = ContextVar("var", default="outer")
+        context = copy_context()
+        context.run(var.set, "inner")
+
+        async def source():
+            yield {"type": "done", "value": var.get()}
+
+        events = await _collect(coalesce_content(source(), context=context))
+
+        assert events == [{"type": "done", "value": "inner"}]
+        assert var.get() == "outer"
+
+
+class TestWithKeepalive:
+    """Test keepalive frames on idle streams."""
+
+    @pytest.mark.asyncio
+    async def test_passes_frames_through(self):
+        """Frames from a busy stream are forwarded unchanged."""
+
+        async def source():
+            yield b"a"
+            yield b"b"
+
+        assert await _collect(with_keepalive(source(), interval=1)) == [b"a", b"b"]
+
+    @pytest.mark.asyncio
+    async def test_sends_keepalive_while_idle(self):
+        """A comment frame is sent when the source is idle."""
+
+        async def source():
+            await asyncio.sleep(0.05)
+            yield b"a"
+
+        frames = await _collect(with_keepalive(source(), interval=0.01))
+
+        assert frames[-1] == b"a"
+        assert KEEPALIVE_FRAME in frames[:-1]
+
+    @pytest.mark.asyncio
+    async def test_source_runs_ahead_of_slow_consumer(self):
+        """The source keeps producing while the consumer is not reading."""
+        finished = asyncio.Event()
+
+        async def source():
+            for _ in range(10):
+                yield b"a"
+            finished.set()
+
+        stream = with_keepalive(source(), interval=1)
+        assert await anext(stream) == b"a"
+
+        await asyncio.wait_for(finished.wait(), timeout=1)
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_propagates_source_errors(self):
+        """Errors from the source stream are re-raised to the consumer."""
+
+        async def source():
+            yield b"a"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await _collect(with_keepalive(source(), interval=1))
+
+    @pytest.mark.asyncio
+    async def test_closing_cancels_source(self):
+        """Closing the stream cancels the source like a client disconnect."""
+        cancelled = asyncio.Event()
+
+        async def source():
+            try:
+                yield b"a"
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        stream = with_keepalive(source(), interval=1)
+        assert await anext(stream) == b"a"
+        await stream.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
@@ -32,17 +32,16 @@ class TestTaskServiceStateTransitions:
         """
         task_id = UUID(mock_task_pending["id"])
 
-        # Setup: First call (get) returns pending task
-        # Second call (update) returns in_progress task
+        # Setup: The conditional update returns the in_progress task
         updated_task = {**mock_task_pending, "status": "in_progress"}
-        mock_supabase.execute.side_effect = [
-            MagicMock(data=[mock_task_pending]),  # get() call
-            MagicMock(data=[updated_task]),  # update() call
-        ]
+        mock_supabase.execute.return_value = MagicMock(data=[updated_task])
 
         result = await task_service.start_task(task_id)
 
         assert result.status == TaskStatus.IN_PROGRESS
+        # Single conditional update, no separate read
+        assert mock_supabase.execute.call_count == 1
+        mock_supabase.eq.assert_any_call("status", "pending")
 
     @pytest.mark.asyncio
     async def test_complete_task_from_in_progress(
@@ -62,13 +61,13 @@ class TestTaskServiceStateTransitions:
             "result": result_text,
         }
 
-        mock_supabase.execute.side_effect = [
-            MagicMock(data=[mock_task_in_progress]),  # get() call
-            MagicMock(data=[completed_task]),  # update() call
-        ]
+        mock_supabase.execute.return_value = MagicMock(data=[completed_task])
 
         result = await task_service.complete_task(task_id, result_text)
 
+        assert mock_supabase.execute.call_count == 1
+        mock_supabase.eq.assert_any_call("status", "in_progress")
+
         assert result.status == TaskStatus.DONE
         assert result.result == result_text
 
@@ -90,13 +89,12 @@ class TestTaskServiceStateTransitions:
             "result": error,
         }
 
-        mock_supabase.execute.side_effect = [
-            MagicMock(data=[mock_task_in_progress]),  # get() call
-            MagicMock(data=[failed_task]),  # update() call
-        ]
+        mock_supabase.execute.return_value = MagicMock(data=[failed_task])
 
         result = await task_service.fail_task(task_id, error)
 
+        assert mock_supabase.execute.call_count == 1
+
         assert result.status == TaskStatus.FAILED
         assert result.result == error
 
@@ -125,7 +123,10 @@ class TestTaskServiceErrors:
         """
         task_id = UUID(mock_task_in_progress["id"])
 
-        mock_supabase.execute.return_value = MagicMock(data=[mock_task_in_progress])
+        mock_supabase.execute.side_effect = [
+            MagicMock(data=[]),  # conditional update matches no pending task
+            MagicMock(data=[mock_task_in_progress]),  # get() call
+        ]
 
         # Should not raise - allows resuming from in_progress
         result = await task_service.start_task(task_id)
@@ -143,7 +144,10 @@ class TestTaskServiceErrors:
         """
         task_id = UUID(mock_task_pending["id"])
 
-        mock_supabase.execute.return_value = MagicMock(data=[mock_task_pending])
+        mock_supabase.execute.side_effect = [
+            MagicMock(data=[]),  # conditional update matches no in_progress task
+            MagicMock(data=[mock_task_pending]),  # get() call
+        ]
 
         with pytest.raises(ValueError, match="expected 'in_progress'"):
             await task_service.complete_task(task_id, "result")
@@ -159,7 +163,10 @@ class TestTaskServiceErrors:
         """
         task_id = UUID(mock_task_done["id"])
 
-        mock_supabase.execute.return_value = MagicMock(data=[mock_task_done])
+        mock_supabase.execute.side_effect = [
+            MagicMock(data=[]),  # conditional update matches no in_progress task
+            MagicMock(data=[mock_task_done]),  # get() call
+        ]
 
         with pytest.raises(ValueError, match="expected 'in_progress'"):
             await task_service.complete_task(task_id, "another result")
@@ -205,3 +212,67 @@ class TestTaskServiceQueries:
         assert result[1].title == "Second task"
         assert result[0].order == 0
         assert result[1].order == 1
+
+    @pytest.mark.asyncio
+    async def test_replace_by_session_uses_single_rpc(
+        self, task_service, mock_supabase, mock_task_pending
+    ):
+        """Replaces a session's tasks with one atomic RPC call.
+
+        Verifies that the delete and insert go through the
+        replace_session_tasks function and results come back in order.
+        """
+        from app.models.task import TaskCreate
+
+        session_id = UUID(mock_task_pending["session_id"])
+        creates = [
+            TaskCreate(session_id=session_id, title="First task", order=0),
+            TaskCreate(session_id=session_id, title="Second task", order=1),
+        ]
+        task2 = {
+            **mock_task_pending,
+            "id": "123e4567-e89b-12d3-a456-426614174099",
+            "order": 1,
+            "title": "Second task",
+        }
+        task1 = {**mock_task_pending, "order": 0, "title": "First task"}
+        mock_supabase.execute.return_value = MagicMock(data=[task2, task1])
+
+        result = await task_service.replace_by_session(session_id, creates)
+
+        mock_supabase.rpc.assert_called_once()
+        name, params = mock_supabase.rpc.call_args.args
+        assert name == "replace_session_tasks"
+        assert params["p_session_id"] == str(session_id)
+        assert [t["title"] for t in params["p_tasks"]] == ["First task", "Second task"]
+        mock_supabase.delete.assert_not_called()
+        assert [t.title for t in result] == ["First task", "Second task"]
+
+    @pytest.mark.asyncio
+    async def test_get_results_summary_single_query(
+        self, task_service, mock_supabase, mock_task_pending
+    ):
+        """Summarizes completed results and status counts from one query.
+
+        Verifies that only the needed columns are selected and that done
+        and failed tasks are tallied from the same rows.
+        """
+        session_id = UUID(mock_task_pending["session_id"])
+        mock_supabase.execute.return_value = MagicMock(
+            data=[
+                {"title": "First task", "result": "Found it", "status": "done"},
+                {"title": "Second task", "result": "Boom", "status": "failed"},
+                {"title": "Third task", "result": None, "status": "done"},
+                {"title": "Fourth task", "result": None, "status": "pending"},
+            ]
+        )
+
+        summary = await task_service.get_results_summary(session_id)
+
+        assert mock_supabase.execute.call_count == 1
+        mock_supabase.select.assert_called_once_with("title, result, status")
+        assert summary.task_results == [
+            {"title": "First task", "result": "Found it"},
+            {"title": "Third task", "result": "Completed"},
+        ]
+        assert (summary.total, summary.completed, summary.failed) == (4, 2, 1)
@@ -0,0 +1,39 @@
+"""Tests for input validation helpers."""
+
+from uuid import UUID
+
+import pytest
+
+from app.core.validation import parse_uuid
+
+VALID_UUID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+class TestParseUuid:
+    """Test UUID parsing at the tool boundary."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [VALID_UUID, VALID_UUID.upper(), VALID_UUID.replace("-", "")],
+    )
+    def test_parses_valid_uuids(self, value):
+        """Hyphenated, uppercase and compact forms are accepted."""
+        assert parse_uuid(value) == UUID(VALID_UUID)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "current_session",
+            VALID_UUID + "0",
+            VALID_UUID[:-1] + "g",
+            " " + VALID_UUID,
+        ],
+    )
+    def test_rejects_malformed_uuids(self, value):
+        """Malformed IDs return None instead of raising."""
+        assert parse_uuid(value) is None
+
+    def test_rejects_partially_hyphenated_uuid(self):
+        """Hyphens must be used in every group or none."""
+        assert parse_uuid("123e4567e89b-12d3-a456-426614174000") is None
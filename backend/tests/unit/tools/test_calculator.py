@@ -313,3 +313,39 @@ class TestSafeEvaluator:
 
         assert safe_eval("2 + 2") == 4.0
         assert safe_eval("sqrt(16)") == 4.0
+
+    def test_compiled_expressions_are_cached(self):
+        """Repeated expressions reuse the compiled callable."""
+        from app.agent.tools.calculator import _compile
+
+        assert _compile("3 * 7") is _compile("3 * 7")
+
+    def test_guards_apply_to_computed_operands(self):
+        """Division and exponent checks still run for non-literal operands."""
+        from app.agent.tools.calculator import safe_eval
+
+        with pytest.raises(ValueError, match="Division by zero"):
+            safe_eval("1 / (2 - 2)")
+        with pytest.raises(ValueError, match="Exponent too large"):
+            safe_eval("2 ** (1000 + 1)")
+
+    def test_constant_subexpressions_are_folded(self):
+        """Constant operands and safe calls fold into a single constant."""
+        import ast
+
+        from app.agent.tools.calculator import ConstantFolder, SafeCompiler
+
+        tree = SafeCompiler().visit(ast.parse("2 * 3 + sqrt(16) / 2", mode="eval"))
+        folded = ConstantFolder().visit(tree)
+
+        assert isinstance(folded.body, ast.Constant)
+        assert folded.body.value == 8.0
+
+    def test_folding_keeps_errors_for_evaluation(self):
+        """Constant sub-expressions that raise still raise when evaluated."""
+        from app.agent.tools.calculator import safe_eval
+
+        with pytest.raises(ValueError, match="Division by zero"):
+            safe_eval("1 / 0")
+        with pytest.raises(ValueError):
+            safe_eval("sqrt(-1)")
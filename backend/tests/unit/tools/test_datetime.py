@@ -186,6 +186,28 @@ class TestFormatDate:
 
         assert "Error" in result or "error" in result.lower()
 
+    def test_unpadded_iso_date_still_parses(self):
+        """Dates strptime accepts but fromisoformat does not still parse."""
+        from app.agent.tools.datetime_tool import format_date
+
+        result = format_date.invoke({
+            "date_string": "2025-1-5",
+            "output_format": "iso"
+        })
+
+        assert result == "2025-01-05"
+
+    def test_impossible_iso_date_returns_error(self):
+        """An ISO-shaped but impossible date returns error."""
+        from app.agent.tools.datetime_tool import format_date
+
+        result = format_date.invoke({
+            "date_string": "2025-02-30",
+            "output_format": "iso"
+        })
+
+        assert "Error" in result
+
 
 class TestCalculateDateDifference:
     """Test calculate_date_difference tool (T043)."""
@@ -373,6 +395,17 @@ class TestAddTimeToDate:
         # Should become Feb 28 in non-leap year
         assert result == "2025-02-28"
 
+    def test_subtract_months_across_years(self):
+        """Subtracting more than a year of months clamps the day."""
+        from app.agent.tools.datetime_tool import add_time_to_date
+
+        result = add_time_to_date.invoke({
+            "date_string": "2024-03-31",
+            "months": -13
+        })
+
+        assert result == "2023-02-28"
+
     def test_combined_additions(self):
         """Multiple time units can be added together."""
         from app.agent.tools.datetime_tool import add_time_to_date
@@ -0,0 +1,14 @@
+"""Tests for the tools package exports."""
+
+from langchain_core.tools import BaseTool
+
+
+class TestLazyToolImports:
+    """Test on-demand import of the Tavily-based tools."""
+
+    def test_lazy_tools_resolve_to_tool_objects(self):
+        """Package attributes stay bound to the tools, not their modules."""
+        import app.agent.tools as tools
+
+        assert isinstance(tools.web_search, BaseTool)
+        assert isinstance(tools.web_fetch, BaseTool)
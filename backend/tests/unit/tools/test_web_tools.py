@@ -0,0 +1,85 @@
+"""Tests for the Tavily-based web tools."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+@pytest.fixture
+def tavily_client():
+    """Patch the shared Tavily client and start with empty result caches."""
+    client = MagicMock()
+    with (
+        patch("app.agent.tools.web_search.get_tavily_client", return_value=client),
+        patch("app.agent.tools.web_fetch.get_tavily_client", return_value=client),
+        patch("app.agent.tools.web_search._search_cache", TTLCache(256, 900)),
+        patch("app.agent.tools.web_fetch._fetch_cache", TTLCache(256, 900)),
+    ):
+        yield client
+
+
+class TestWebSearch:
+    """Test web_search caching and timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_is_served_from_cache(self, tavily_client):
+        """The same query only hits the API once."""
+        from app.agent.tools.web_search import web_search
+
+        tavily_client.search = AsyncMock(
+            return_value={"results": [{"title": "T", "content": "C", "url": "U"}]}
+        )
+
+        first = await web_search.ainvoke({"query": "python"})
+        second = await web_search.ainvoke({"query": "python"})
+
+        assert first == second
+        assert "1. T" in first
+        tavily_client.search.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_error(self, tavily_client):
+        """A search exceeding the timeout returns an error message."""
+        from app.agent.tools.web_search import web_search
+
+        async def slow_search(**kwargs):
+            await asyncio.sleep(1)
+
+        tavily_client.search = slow_search
+
+        with patch("app.agent.tools.web_search._SEARCH_TIMEOUT_SECONDS", 0.01):
+            result = await web_search.ainvoke({"query": "python"})
+
+        assert "timed out" in result
+
+
+class TestWebFetch:
+    """Test web_fetch caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_url_is_served_from_cache(self, tavily_client):
+        """The same URL only hits the API once."""
+        from app.agent.tools.web_fetch import web_fetch
+
+        tavily_client.extract = AsyncMock(
+            return_value={"results": [{"raw_content": "page text"}]}
+        )
+
+        assert await web_fetch.ainvoke({"url": "https://example.com"}) == "page text"
+        assert await web_fetch.ainvoke({"url": "https://example.com"}) == "page text"
+        tavily_client.extract.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, tavily_client):
+        """API failures are retried on the next call."""
+        from app.agent.tools.web_fetch import web_fetch
+
+        tavily_client.extract = AsyncMock(
+            side_effect=[RuntimeError("boom"), {"results": [{"raw_content": "ok"}]}]
+        )
+
+        assert "Error" in await web_fetch.ainvoke({"url": "https://example.com"})
+        assert await web_fetch.ainvoke({"url": "https://example.com"}) == "ok"
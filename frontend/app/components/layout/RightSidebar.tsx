@@ -21,6 +21,7 @@ interface RightSidebarProps {
   showExecuteButton: boolean;
   // Task extraction indicator
   isExtractingTasks?: boolean;
+  extractingTitles?: string[];
   // Optional: control which tab is initially open
   defaultTab?: TabType;
   // Resume mode (paused session)
@@ -38,6 +39,7 @@ export function RightSidebar({
   onExecute,
   showExecuteButton,
   isExtractingTasks = false,
+  extractingTitles = [],
   defaultTab = null,
   isResume = false,
 }: RightSidebarProps) {
@@ -74,6 +76,7 @@ export function RightSidebar({
             <TasksPanelContent
               tasks={tasks}
               isExtractingTasks={isExtractingTasks}
+              extractingTitles={extractingTitles}
               canExecute={canExecute}
               isExecuting={isExecuting}
               isPausing={isPausing}
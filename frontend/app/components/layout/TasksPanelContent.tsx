@@ -1,13 +1,16 @@
-import { ListTodo, Loader2 } from "lucide-react";
+import { Circle, ListTodo, Loader2 } from "lucide-react";
 import type { Task } from "@/types/api";
 import { TaskItem } from "@/components/session/TaskItem";
 import { ExecuteButton } from "@/components/session/ExecuteButton";
 import { ScrollArea } from "@/components/ui/scroll-area";
 import { Badge } from "@/components/ui/badge";
+import { Card } from "@/components/ui/card";
 
 interface TasksPanelContentProps {
   tasks: Task[];
   isExtractingTasks?: boolean;
+  // Task titles streamed so far during extraction
+  extractingTitles?: string[];
   // Execute button props
   canExecute: boolean;
   isExecuting: boolean;
@@ -21,6 +24,7 @@ interface TasksPanelContentProps {
 export function TasksPanelContent({
   tasks,
   isExtractingTasks = false,
+  extractingTitles = [],
   canExecute,
   isExecuting,
   isPausing = false,
@@ -45,7 +49,22 @@ export function TasksPanelContent({
       {/* Content */}
       <ScrollArea className="flex-1">
         <div className="p-3">
-          {isExtractingTasks ? (
+          {isExtractingTasks && extractingTitles.length > 0 ? (
+            <div className="space-y-2">
+              {extractingTitles.map((title, index) => (
+                <Card key={index} className="p-3">
+                  <div className="flex items-start gap-3">
+                    <Circle className="h-5 w-5 mt-0.5 flex-shrink-0 text-muted-foreground" />
+                    <p className="text-sm font-medium">{title}</p>
+                  </div>
+                </Card>
+              ))}
+              <div className="flex items-center gap-2 p-3 text-muted-foreground">
+                <Loader2 className="h-4 w-4 animate-spin" />
+                <p className="text-xs">Generating tasks...</p>
+              </div>
+            </div>
+          ) : isExtractingTasks ? (
             <div className="flex flex-col items-center justify-center py-8 text-muted-foreground">
               <Loader2 className="h-8 w-8 mb-2 animate-spin" />
               <p className="text-sm font-medium">Generating tasks...</p>
@@ -57,6 +57,7 @@ export function SessionPage() {
   const [streamingContent, setStreamingContent] = useState("");
   const [isSending, setIsSending] = useState(false);
   const [isExtractingTasks, setIsExtractingTasks] = useState(false);
+  const [extractingTitles, setExtractingTitles] = useState<string[]>([]);
 
   // Execution state
   const [isExecuting, setIsExecuting] = useState(false);
@@ -190,9 +191,11 @@ export function SessionPage() {
           break;
         case "tasks_extracting":
           setIsExtractingTasks(true);
+          setExtractingTitles(event.titles ?? []);
           break;
         case "tasks_updated":
           setIsExtractingTasks(false);
+          setExtractingTitles([]);
           setTasks(event.tasks);
           break;
         case "done": {
@@ -207,6 +210,7 @@ export function SessionPage() {
           setStreamingContent("");
           setIsSending(false);
           setIsExtractingTasks(false);
+          setExtractingTitles([]);
           // Clear global busy state
           setBusySessionRef.current(null);
           // Refresh session title (may have been updated on first message)
@@ -220,6 +224,7 @@ export function SessionPage() {
           setStreamingContent("");
           setIsSending(false);
           setIsExtractingTasks(false);
+          setExtractingTitles([]);
           // Clear global busy state
           setBusySessionRef.current(null);
           break;
@@ -732,6 +737,7 @@ export function SessionPage() {
         onExecute={handleExecuteOrPause}
         showExecuteButton={session?.status !== "completed"}
         isExtractingTasks={isExtractingTasks}
+        extractingTitles={extractingTitles}
         isResume={isResume}
       />
 
@@ -748,6 +754,7 @@ export function SessionPage() {
           <TasksPanelContent
             tasks={tasks}
             isExtractingTasks={isExtractingTasks}
+            extractingTitles={extractingTitles}
             canExecute={canExecute}
             isExecuting={isExecuting}
             isPausing={isPausing}
@@ -76,6 +76,7 @@ export interface ChatContentEvent {
 
 export interface ChatTasksExtractingEvent {
   type: "tasks_extracting";
+  titles?: string[];  // Task titles streamed so far during extraction
 }
 
 export interface ChatTasksUpdatedEvent {
@@ -187,7 +188,7 @@ export interface ExecutionDoneEvent {
 
 export interface ExecutionPausedEvent {
   type: "paused";
-  reason: "client_disconnected" | "user_requested";
+  reason: "client_disconnected" | "user_requested" | "error";
 }
 
 export interface ExecutionResumedEvent {
@@ -0,0 +1,17 @@
+-- Replace all tasks for a session in a single transaction
+-- Called when the planning agent regenerates the task list, so the delete and
+-- insert happen in one round-trip and a failure never leaves the session empty
+CREATE OR REPLACE FUNCTION replace_session_tasks(p_session_id UUID, p_tasks JSONB)
+RETURNS SETOF tasks AS $$
+BEGIN
+    DELETE FROM tasks WHERE session_id = p_session_id;
+
+    RETURN QUERY
+    INSERT INTO tasks (session_id, title, description, "order")
+    SELECT p_session_id, t.title, t.description, t."order"
+    FROM jsonb_to_recordset(p_tasks)
+        AS t(title VARCHAR(500), description VARCHAR(2000), "order" INTEGER)
+    ORDER BY t."order"
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,22 @@
+-- Prepare a session for a chat message in a single round-trip
+-- Sets the title from the first message while the session still has the
+-- default title, and returns nothing if the session is missing or completed
+CREATE OR REPLACE FUNCTION begin_chat(p_session_id UUID, p_title VARCHAR(200))
+RETURNS SETOF sessions AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE sessions
+    SET title = p_title
+    WHERE id = p_session_id
+        AND status <> 'completed'
+        AND title = 'New Session'
+    RETURNING *;
+
+    -- Title already set: return the session without touching updated_at
+    IF NOT FOUND THEN
+        RETURN QUERY
+        SELECT * FROM sessions
+        WHERE id = p_session_id AND status <> 'completed';
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
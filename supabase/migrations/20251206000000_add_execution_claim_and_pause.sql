@@ -0,0 +1,66 @@
+-- Claim an executing session for a new connection in a single round-trip
+-- Pauses the session and registers a fresh connection_id (superseding the old
+-- execution) only if it is executing. Returns the session, plus the new
+-- connection_id when claimed, or NULL if the session does not exist.
+CREATE OR REPLACE FUNCTION claim_execution(p_session_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    v_session sessions;
+    v_connection_id UUID;
+BEGIN
+    UPDATE sessions
+    SET status = 'paused'
+    WHERE id = p_session_id AND status = 'executing'
+    RETURNING * INTO v_session;
+
+    IF NOT FOUND THEN
+        SELECT * INTO v_session FROM sessions WHERE id = p_session_id;
+        IF NOT FOUND THEN
+            RETURN NULL;
+        END IF;
+        RETURN jsonb_build_object('session', to_jsonb(v_session), 'connection_id', NULL);
+    END IF;
+
+    v_connection_id := gen_random_uuid();
+    INSERT INTO execution_connections
+        (session_id, connection_id, last_heartbeat, created_at, pause_requested)
+    VALUES (p_session_id, v_connection_id, NOW(), NOW(), FALSE)
+    ON CONFLICT (session_id) DO UPDATE SET
+        connection_id = EXCLUDED.connection_id,
+        last_heartbeat = EXCLUDED.last_heartbeat,
+        created_at = EXCLUDED.created_at,
+        pause_requested = FALSE;
+
+    RETURN jsonb_build_object(
+        'session', to_jsonb(v_session),
+        'connection_id', v_connection_id
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Request a pause for an executing session in a single round-trip
+-- Returns whether a pause was requested and the session status, or NULL if
+-- the session does not exist
+CREATE OR REPLACE FUNCTION request_execution_pause(p_session_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    v_status session_status;
+BEGIN
+    SELECT status INTO v_status FROM sessions WHERE id = p_session_id;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    IF v_status = 'executing' THEN
+        UPDATE execution_connections
+        SET pause_requested = TRUE
+        WHERE session_id = p_session_id;
+
+        IF FOUND THEN
+            RETURN jsonb_build_object('paused', TRUE, 'status', v_status);
+        END IF;
+    END IF;
+
+    RETURN jsonb_build_object('paused', FALSE, 'status', v_status);
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,60 @@
+-- Start executing a session in a single round-trip
+-- Locks the session so concurrent starts cannot both see it as idle. If it is
+-- planning (pending tasks) or paused (in_progress and pending tasks) and has
+-- tasks to run, sets it to executing and registers a fresh connection_id,
+-- superseding any previous execution. Returns the session, the tasks to run
+-- and the new connection_id (NULL with no tasks when execution did not
+-- start), or NULL if the session does not exist.
+CREATE OR REPLACE FUNCTION begin_execution(p_session_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    v_session sessions;
+    v_tasks JSONB;
+    v_connection_id UUID;
+BEGIN
+    SELECT * INTO v_session FROM sessions WHERE id = p_session_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    IF v_session.status IN ('planning', 'paused') THEN
+        SELECT jsonb_agg(to_jsonb(t) ORDER BY t."order")
+        INTO v_tasks
+        FROM tasks t
+        WHERE t.session_id = p_session_id
+            AND (
+                t.status = 'pending'
+                OR (v_session.status = 'paused' AND t.status = 'in_progress')
+            );
+    END IF;
+
+    IF v_tasks IS NULL THEN
+        RETURN jsonb_build_object(
+            'session', to_jsonb(v_session),
+            'tasks', '[]'::jsonb,
+            'connection_id', NULL
+        );
+    END IF;
+
+    UPDATE sessions
+    SET status = 'executing'
+    WHERE id = p_session_id
+    RETURNING * INTO v_session;
+
+    v_connection_id := gen_random_uuid();
+    INSERT INTO execution_connections
+        (session_id, connection_id, last_heartbeat, created_at, pause_requested)
+    VALUES (p_session_id, v_connection_id, NOW(), NOW(), FALSE)
+    ON CONFLICT (session_id) DO UPDATE SET
+        connection_id = EXCLUDED.connection_id,
+        last_heartbeat = EXCLUDED.last_heartbeat,
+        created_at = EXCLUDED.created_at,
+        pause_requested = FALSE;
+
+    RETURN jsonb_build_object(
+        'session', to_jsonb(v_session),
+        'tasks', v_tasks,
+        'connection_id', v_connection_id
+    );
+END;
+$$ LANGUAGE plpgsql;